@@ -0,0 +1,32 @@
+"""Factory for Bedrock-backed pydantic-ai models."""
+
+import os
+
+from botocore.client import BaseClient
+from pydantic_ai.models.bedrock import BedrockConverseModel, BedrockModelSettings
+from pydantic_ai.providers.bedrock import BedrockProvider
+
+# Latency-optimized inference is only available for some models and regions,
+# so it is opt-in via BEDROCK_LATENCY_OPTIMIZED=true
+LATENCY_OPTIMIZED = (
+    os.environ.get("BEDROCK_LATENCY_OPTIMIZED", "false").lower() == "true"
+)
+
+
+def _model_settings() -> BedrockModelSettings | None:
+    """Build default model settings from the environment."""
+    if not LATENCY_OPTIMIZED:
+        return None
+    return BedrockModelSettings(
+        bedrock_performance_configuration={"latency": "optimized"}
+    )
+
+
+def setup_bedrock_model(
+    bedrock_client: BaseClient, model_name: str
+) -> BedrockConverseModel:
+    """Create a Bedrock model instance with the given client and model name."""
+    bedrock_provider = BedrockProvider(bedrock_client=bedrock_client)
+    return BedrockConverseModel(
+        model_name=model_name, provider=bedrock_provider, settings=_model_settings()
+    )
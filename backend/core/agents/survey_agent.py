@@ -1,27 +1,30 @@
 """Survey analysis agent for processing survey data with semantic search."""
 
+import asyncio
 import os
+from functools import cache
 
 import pandas as pd
 from botocore.client import BaseClient
 from pydantic_ai import Agent
-from pydantic_ai.models.bedrock import BedrockConverseModel
-from pydantic_ai.providers.bedrock import BedrockProvider
 
+from backend.core.agents.bedrock_model import setup_bedrock_model
 from backend.core.agents.tools.semantic_search_tool import register_semantic_search_tool
 from backend.core.deps.agent_deps import AnalystAgentDeps
 from backend.core.models.analysis_output import AnalysisOutput
 from backend.core.prompts.agent_prompt import AGENT_INSTRUCTIONS
 from backend.core.services.citation_resolver import resolve_citations
-from backend.core.services.embeddings_service import EmbeddingStore
+from backend.core.services.embeddings_service import (
+    SEARCH_METADATA_FIELDS,
+    EmbeddingStore,
+)
 from backend.core.utils.aws_client_service import get_client
 from backend.core.utils.logger import configure_logfire
 
-
-def setup_bedrock_model(bedrock_client, model_name):
-    """Create a Bedrock model instance with the given client and model name."""
-    bedrock_provider = BedrockProvider(bedrock_client=bedrock_client)
-    return BedrockConverseModel(model_name=model_name, provider=bedrock_provider)
+# Columns exported in search_results, in output order
+SEARCH_RESULT_COLUMNS = ("id", "similarity_score", *SEARCH_METADATA_FIELDS)
+# Maximum number of rows exported in search_results (highest similarity first)
+MAX_SEARCH_RESULT_ROWS = int(os.environ.get("MAX_SEARCH_RESULT_ROWS", "1000"))
 
 
 def register_tools(
@@ -31,16 +34,23 @@ def register_tools(
     register_semantic_search_tool(agent, bedrock_client, model_name)
 
 
+@cache
 def init_agent():
     """
     Initialize the survey agent with all dependencies.
 
+    The result is cached so repeated calls in a warm process reuse the same
+    Bedrock client, embedding store, and agent.
+
     Returns:
         tuple: (agent, embedding_store) ready for querying
     """
     configure_logfire()
 
-    bedrock_client = get_client("bedrock-runtime", read_timeout=600)
+    # Concurrent query embeddings share this client's connection pool
+    bedrock_client = get_client(
+        "bedrock-runtime", read_timeout=600, max_pool_connections=64
+    )
     model_name = os.environ.get(
         "BEDROCK_MODEL_NAME", "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
     )
@@ -59,23 +69,38 @@ def init_agent():
     return agent, embedding_store
 
 
+async def arun_query(agent: Agent[None, str], query: str, deps: AnalystAgentDeps):
+    """
+    Run a query against the survey agent without blocking the event loop.
+
+    Args:
+        agent: The initialized agent instance
+        query: The user query to process
+        deps: Agent dependencies for this run
+
+    Returns:
+        AnalysisOutput: The agent's structured response
+    """
+    result = await agent.run(user_prompt=query, deps=deps)
+    return result.output
+
+
 def run_query(agent: Agent[None, str], query: str, deps: AnalystAgentDeps):
     """
     Run a query against the survey agent.
 
     Args:
         agent: The initialized agent instance
-        embedding_store: The embedding store instance
         query: The user query to process
+        deps: Agent dependencies for this run
 
     Returns:
         AnalysisOutput: The agent's structured response
     """
-    result = agent.run_sync(user_prompt=query, deps=deps)
-    return result.output
+    return asyncio.run(arun_query(agent=agent, query=query, deps=deps))
 
 
-def run_query_with_citations(agent: Agent[None, str], embedding_store, query):
+async def arun_query_with_citations(agent: Agent[None, str], embedding_store, query):
     """
     Run a query against the survey agent and return results with citations.
 
@@ -88,10 +113,12 @@ def run_query_with_citations(agent: Agent[None, str], embedding_store, query):
         dict: Contains 'response', 'cited_responses', 'cited_count', and 'search_results'
     """
     deps = AnalystAgentDeps(embedding_store=embedding_store)
-    output: AnalysisOutput = run_query(agent=agent, query=query, deps=deps)
+    output: AnalysisOutput = await arun_query(agent=agent, query=query, deps=deps)
 
     # Combine all search results into single DataFrame
-    if deps.search_results:
+    if len(deps.search_results) == 1:
+        combined_df = deps.search_results[0]
+    elif deps.search_results:
         combined_df = pd.concat(deps.search_results, ignore_index=True)
     else:
         combined_df = pd.DataFrame()
@@ -100,12 +127,7 @@ def run_query_with_citations(agent: Agent[None, str], embedding_store, query):
     cited_responses = resolve_citations(output, combined_df)
 
     # Build id -> excerpt mapping for markdown formatting
-    id_to_excerpt = {}
-    if not combined_df.empty:
-        for c in cited_responses:
-            match = combined_df[combined_df["response_id"] == c["response_id"]]
-            if not match.empty:
-                id_to_excerpt[match.iloc[0]["id"]] = c["excerpt"]
+    id_to_excerpt = {c["id"]: c["excerpt"] for c in cited_responses}
 
     enriched_response = _build_enriched_response(output, id_to_excerpt)
 
@@ -113,12 +135,37 @@ def run_query_with_citations(agent: Agent[None, str], embedding_store, query):
         "response": enriched_response,
         "cited_responses": cited_responses,
         "cited_count": len(cited_responses),
-        "search_results": (
-            combined_df.to_dict(orient="records") if not combined_df.empty else []
-        ),
+        "search_results": _build_search_results(combined_df),
     }
 
 
+def run_query_with_citations(agent: Agent[None, str], embedding_store, query):
+    """
+    Run a query against the survey agent and return results with citations.
+
+    Args:
+        agent: The initialized agent instance
+        embedding_store: The embedding store instance
+        query: The user query to process
+
+    Returns:
+        dict: Contains 'response', 'cited_responses', 'cited_count', and 'search_results'
+    """
+    return asyncio.run(arun_query_with_citations(agent, embedding_store, query))
+
+
+def _build_search_results(combined_df: pd.DataFrame) -> list[dict]:
+    """Project and cap search results before converting them to records."""
+    if combined_df.empty:
+        return []
+
+    if len(combined_df) > MAX_SEARCH_RESULT_ROWS:
+        combined_df = combined_df.nlargest(MAX_SEARCH_RESULT_ROWS, "similarity_score")
+
+    columns = [c for c in SEARCH_RESULT_COLUMNS if c in combined_df.columns]
+    return combined_df[columns].to_dict(orient="records")
+
+
 def _build_enriched_response(output: AnalysisOutput, id_to_excerpt: dict) -> dict:
     """Build enriched JSON response with citations resolved to excerpts."""
     return {
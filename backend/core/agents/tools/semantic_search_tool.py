@@ -1,77 +1,137 @@
 """Semantic search tool for multi-query survey response retrieval."""
 
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 from botocore.client import BaseClient
 from pydantic_ai import RunContext, Agent
-from pydantic_ai.models.bedrock import BedrockConverseModel
-from pydantic_ai.providers.bedrock import BedrockProvider
 
+from backend.core.agents.bedrock_model import setup_bedrock_model
 from backend.core.deps.agent_deps import AnalystAgentDeps
 from backend.core.models.rewrite_query import RewrittenQueries
 from backend.core.prompts.query_rewrite_prompt import QUERY_REWRITE_SYSTEM_PROMPT
-from backend.core.utils.agent_utils import generate_random_id
+from backend.core.utils.agent_utils import generate_random_ids
 from backend.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Minimum similarity score for a search result to be returned to the agent
+MIN_SIMILARITY_SCORE = 0.15
+# Maximum number of top-ranked results formatted into the agent's prompt; the
+# full result set is still stored for citation resolution and CSV export
+MAX_ROWS_TO_LLM = int(os.environ.get("MAX_ROWS_TO_LLM", "200"))
+# Number of query rewrites cached per process
+REWRITE_CACHE_SIZE = 1024
+
 
-def format_results_with_ids(df: pd.DataFrame) -> tuple[pd.DataFrame, str]:
+def format_results_with_ids(
+    df: pd.DataFrame, max_rows: int | None = None
+) -> tuple[pd.DataFrame, str]:
     """
     Add an id column and format for LLM consumption.
 
     Args:
         df: DataFrame with response_id, event_name, question, text_answer columns
+        max_rows: Optional cap on the number of leading rows formatted for the LLM
 
     Returns:
-        tuple: (DataFrame with id column, formatted string for LLM)
+        tuple: (DataFrame with id column for all rows, formatted string for LLM)
     """
     if df.empty:
         return df, ""
 
     df = df.copy()
-    df["id"] = [generate_random_id(5) for _ in range(len(df))]
-
-    lines = ["id | Event | Question | Response\n"]
-    for _, row in df.iterrows():
-        lines.append(
-            f"[{row['id']}] {row.get('event_name', 'N/A')} | "
-            f"{row.get('question', 'N/A')} | "
-            f"{row.get('text_answer', 'N/A')}"
-        )
+    df["id"] = generate_random_ids(len(df), length=5)
+
+    llm_df = df if max_rows is None else df.head(max_rows)
+
+    def _column_text(column: str) -> pd.Series:
+        if column not in llm_df.columns:
+            return pd.Series("N/A", index=llm_df.index)
+        return llm_df[column].fillna("N/A").astype(str)
+
+    rows = (
+        "["
+        + llm_df["id"]
+        + "] "
+        + _column_text("event_name")
+        + " | "
+        + _column_text("question")
+        + " | "
+        + _column_text("text_answer")
+    )
+    lines = ["id | Event | Question | Response\n", *rows.tolist()]
 
     return df, "\n".join(lines)
 
 
-def _generate_search_queries(
-    _ctx: RunContext[AnalystAgentDeps],
-    original_query: str,
-    client: BaseClient,
-    model_name: str,
-) -> RewrittenQueries:
-    bedrock_provider = BedrockProvider(bedrock_client=client)
-    model = BedrockConverseModel(model_name=model_name, provider=bedrock_provider)
+def _build_query_rewriter(
+    client: BaseClient, model_name: str
+) -> Callable[[str], tuple[str, ...]]:
+    """Build a cached rewriter that turns a query into search variations.
+
+    The sub-agent is created once here instead of on every tool call, and
+    rewrites are cached per process so repeated queries skip the LLM call.
+    The cache is keyed on the case- and whitespace-normalized query, but the
+    model is prompted with the query as written so proper nouns keep their
+    case.
+    """
     query_agent = Agent(
-        model=model,
+        model=setup_bedrock_model(client, model_name),
         output_type=RewrittenQueries,
         system_prompt=QUERY_REWRITE_SYSTEM_PROMPT,
     )
+    cache: OrderedDict[str, tuple[str, ...]] = OrderedDict()
+    # Tool calls may rewrite queries from several threads at once
+    cache_lock = threading.Lock()
+
+    def rewrite(query: str) -> tuple[str, ...]:
+        query = query.strip()
+        cache_key = query.lower()
+        with cache_lock:
+            if cache_key in cache:
+                cache.move_to_end(cache_key)
+                logger.info("rewrite_cache hit=%s", True)
+                return cache[cache_key]
+        logger.info("rewrite_cache hit=%s", False)
 
-    user_prompt = f"""Original query: {original_query}"""
+        user_prompt = f"""Original query: {query}"""
 
-    try:
-        response = query_agent.run_sync(user_prompt=user_prompt)
-        rewritten_queries: RewrittenQueries = response.output
-        return rewritten_queries
+        try:
+            response = query_agent.run_sync(user_prompt=user_prompt)
+            rewritten_queries: RewrittenQueries = response.output
+            queries = tuple(rewritten_queries.queries)
 
-    except Exception as e:
-        logger.warning("rewrite_query_for_search error: %s", e)
-        raise RuntimeError(f"Failed to generate search queries: {e}") from e
+        except Exception as e:
+            logger.warning("rewrite_query_for_search error: %s", e)
+            raise RuntimeError(f"Failed to generate search queries: {e}") from e
+
+        with cache_lock:
+            cache[cache_key] = queries
+            while len(cache) > REWRITE_CACHE_SIZE:
+                cache.popitem(last=False)
+        return queries
+
+    return rewrite
+
+
+def _generate_search_queries(
+    _ctx: RunContext[AnalystAgentDeps],
+    original_query: str,
+    rewrite: Callable[[str], tuple[str, ...]],
+) -> RewrittenQueries:
+    return RewrittenQueries(queries=list(rewrite(original_query)))
 
 
 def register_semantic_search_tool(
     agent: Agent[None, str], client: BaseClient, model_name: str
 ):
     """Register the multi-query semantic search tool with the agent."""
+    rewrite_query = _build_query_rewriter(client, model_name)
 
     @agent.tool
     def multi_query_search(  # pylint: disable=too-many-locals
@@ -91,87 +151,93 @@ def register_semantic_search_tool(
             Formatted string of deduplicated matching survey responses.
         """
         search_queries: RewrittenQueries = _generate_search_queries(
-            ctx, original_search_query, client, model_name
+            ctx, original_search_query, rewrite_query
         )
-        if not search_queries.queries:
+        queries = [
+            query
+            for query in search_queries.queries
+            if isinstance(query, str) and query.strip()
+        ]
+        if not queries:
             error_msg = "Error: No search queries generated."
             logger.warning("multi_query_search response: %s", error_msg)
             return error_msg
 
-        # Search with each query and collect results
-        # Track seen uids across queries for S3 Vectors $nin exclusion
-        seen_uids = []  # Use list for $nin filter
-        all_dfs = []
-        successful_queries = 0
+        try:
+            embeddings = ctx.deps.embedding_store.embed_batch(queries)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            error_msg = "Error: Failed to embed search queries."
+            logger.warning("multi_query_search response: %s (%s)", error_msg, e)
+            return error_msg
 
-        for query in search_queries.queries:
-            if not isinstance(query, str) or not query.strip():
-                continue
+        def _search(query: str, embedding: list[float]) -> pd.DataFrame | None:
             try:
-                # Execute search with $nin filter to exclude already-seen uids
-                # S3 Vectors will exclude these at the API level, returning NEW results
-                results_df = ctx.deps.embedding_store.search(
-                    query=query,
-                    top_k=top_k_per_query,
-                    exclude_uids=seen_uids if seen_uids else None,
+                return ctx.deps.embedding_store.search_with_vector(
+                    embedding, top_k=top_k_per_query, min_score=MIN_SIMILARITY_SCORE
                 )
-                if not results_df.empty:
-                    # All results are guaranteed to be new (not in seen_uids)
-                    # Update tracking list with new uids
-                    new_uids = results_df["uid"].tolist()
-                    seen_uids.extend(new_uids)
-
-                    all_dfs.append(results_df)
-                    successful_queries += 1
-
-                    # Log stats for monitoring
-                    logger.info(
-                        "Query %d: Retrieved %d new results (total unique: %d)",
-                        successful_queries,
-                        len(results_df),
-                        len(seen_uids),
-                    )
-                else:
-                    logger.info("Query returned no results (possibly all excluded)")
             except Exception:  # pylint: disable=broad-exception-caught
                 logger.warning("Search failed for query '%s'", query)
-                continue
+                return None
 
-        # Log summary after all queries
-        logger.info(
-            "Multi-query search complete: %d queries executed, %d unique responses found",
-            successful_queries,
-            len(seen_uids),
-        )
+        # Each search is an independent, blocking S3 Vectors round-trip, so run
+        # them concurrently and deduplicate on uid afterwards
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            results = list(executor.map(_search, queries, embeddings))
+
+        all_dfs = []
+        successful_queries = 0
+        for results_df in results:
+            if results_df is None:
+                continue
+            if results_df.empty:
+                logger.info("Query returned no results")
+                continue
+            successful_queries += 1
+            logger.info(
+                "Query %d: Retrieved %d results", successful_queries, len(results_df)
+            )
+            all_dfs.append(results_df)
 
         if not all_dfs:
-            no_match_msg = "No matching responses found."
+            no_match_msg = (
+                "No matching responses found with similarity >= "
+                f"{MIN_SIMILARITY_SCORE}."
+            )
             logger.info("multi_query_search response: %s", no_match_msg)
             return no_match_msg
 
-        # Concatenate all results (already guaranteed unique by S3 Vectors $nin filter)
-        combined_df = pd.concat(all_dfs, ignore_index=True)
+        combined_df = (
+            pd.concat(all_dfs, ignore_index=True) if len(all_dfs) > 1 else all_dfs[0]
+        )
 
-        # Sort by similarity score for ranking
+        # Sort by similarity score for ranking, keeping each uid's best match
         combined_df = combined_df.sort_values("similarity_score", ascending=False)
-        # Filter by minimum similarity threshold
-        combined_df = combined_df[combined_df["similarity_score"] >= 0.15]
+        combined_df = combined_df.drop_duplicates(subset="uid", keep="first")
 
-        if combined_df.empty:
-            threshold_msg = "No matching responses found with similarity >= 0.15."
-            logger.info("multi_query_search response: %s", threshold_msg)
-            return threshold_msg
+        # Log summary after all queries
+        logger.info(
+            "Multi-query search complete: %d queries executed, %d unique responses found",
+            successful_queries,
+            len(combined_df),
+        )
 
         # Store DataFrame with an id column for citation resolution
-        combined_df_with_ids, indexed_results = format_results_with_ids(combined_df)
+        combined_df_with_ids, indexed_results = format_results_with_ids(
+            combined_df, max_rows=MAX_ROWS_TO_LLM
+        )
         ctx.deps.store_search_result(combined_df_with_ids)
 
         total_unique = len(combined_df_with_ids)
 
         # Format output for agent
+        shown = (
+            f" (showing top {MAX_ROWS_TO_LLM} by similarity)"
+            if total_unique > MAX_ROWS_TO_LLM
+            else ""
+        )
         header = (
             f"Found {total_unique} unique responses across "
-            f"{successful_queries} queries:\n\n"
+            f"{successful_queries} queries{shown}:\n\n"
         )
         result = header + indexed_results
         logger.info(
@@ -35,5 +35,8 @@ class AnalystAgentDeps:
         return self.output[ref]
 
     def store_search_result(self, df: pd.DataFrame) -> None:
-        """Store search result DataFrame for later reference."""
-        self.search_results.append(df.copy())
+        """Store search result DataFrame for later reference.
+
+        The frame is stored as-is; callers must not mutate it afterwards.
+        """
+        self.search_results.append(df)
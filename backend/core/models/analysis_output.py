@@ -1,11 +1,13 @@
 """Structured output models for survey analysis agent."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class Theme(BaseModel):
     """A theme identified in the analysis."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str = Field(description="Short, descriptive label for the theme.")
     summary: str = Field(
         description="A concise summary of what respondents said about this theme."
@@ -19,6 +21,8 @@ class Theme(BaseModel):
 class AnalysisOutput(BaseModel):
     """Structured output from the survey analysis agent."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     summary: str = Field(
         description="High-level summary of the overall survey analysis findings."
     )
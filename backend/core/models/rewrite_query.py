@@ -1,11 +1,13 @@
 """Model for rewritten search queries."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class RewrittenQueries(BaseModel):
     """Pydantic model for rewritten queries output."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     queries: list[str] = Field(
         description="List of 10 diverse search queries", min_length=1, max_length=10
     )
@@ -4,6 +4,28 @@ import pandas as pd
 
 from backend.core.models.analysis_output import AnalysisOutput
 
+# Defaults for optional search result columns
+_OPTIONAL_COLUMN_DEFAULTS = {
+    "csv_source": "",
+    "event_name": "",
+    "text_answer": "",
+    "question": "",
+    "similarity_score": 0.0,
+}
+
+# Cited response key -> source column in the merged frame
+_CITATION_COLUMNS = {
+    "id": "id",
+    "response_id": "response_id",
+    "survey_id": "csv_source",
+    "game_name": "event_name",
+    "response_text": "text_answer",
+    "question": "question",
+    "similarity_score": "similarity_score",
+    "excerpt": "text_answer",
+    "theme": "theme",
+}
+
 
 def resolve_citations(
     output: AnalysisOutput, search_results_df: pd.DataFrame
@@ -21,23 +43,28 @@ def resolve_citations(
     if search_results_df.empty:
         return []
 
-    cited = []
-    for theme in output.themes:
-        for citation_id in theme.supporting_citations:
-            match = search_results_df[search_results_df["id"] == citation_id]
-            if not match.empty:
-                result = match.iloc[0]
-                cited.append(
-                    {
-                        "response_id": result["response_id"],
-                        "survey_id": result.get("csv_source", ""),
-                        "game_name": result.get("event_name", ""),
-                        "response_text": result.get("text_answer", ""),
-                        "question": result.get("question", ""),
-                        "similarity_score": result.get("similarity_score", 0.0),
-                        "excerpt": result.get("text_answer", ""),
-                        "theme": theme.name,
-                    }
-                )
-
-    return cited
+    pairs = pd.DataFrame(
+        [
+            (theme.name, citation_id)
+            for theme in output.themes
+            for citation_id in theme.supporting_citations
+        ],
+        columns=["theme", "id"],
+    )
+    if pairs.empty:
+        return []
+
+    results = search_results_df.drop_duplicates(subset="id").assign(
+        **{
+            column: default
+            for column, default in _OPTIONAL_COLUMN_DEFAULTS.items()
+            if column not in search_results_df.columns
+        }
+    )
+
+    # Inner merge drops unknown ids and preserves the citation order
+    merged = pairs.merge(results, on="id", how="inner")
+    cited = pd.DataFrame(
+        {key: merged[column] for key, column in _CITATION_COLUMNS.items()}
+    )
+    return cited.to_dict(orient="records")
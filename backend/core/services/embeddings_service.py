@@ -1,23 +1,69 @@
 """Service for managing survey response embeddings with S3 Vectors and AWS Titan."""
 
-import json
 import os
+import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
+import orjson
 import pandas as pd
 from botocore.exceptions import ClientError
 
-from backend.core.utils.agent_utils import generate_random_id
+from backend.core.utils.agent_utils import generate_random_ids
 from backend.core.utils.aws_client_service import get_client
 from backend.core.utils.logger import get_logger
+from backend.core.utils.rate_limiter import RateLimiter
 
 logger = get_logger(__name__)
 
+# Metadata fields returned as columns by search, after uid and similarity_score
+SEARCH_METADATA_FIELDS = (
+    "text_answer",
+    "question",
+    "event_name",
+    "event_code",
+    "question_type",
+    "nps_group",
+    "response_id",
+    "csv_source",
+)
 
-def generate_uid() -> str:
-    """Generate a random 7-character unique ID."""
-    return generate_random_id(7)
+
+# CSV column -> (vector metadata field, max length) copied by add_dataframe
+# Lengths keep filterable metadata under 2KB; text_answer holds the main text
+METADATA_SOURCE_COLUMNS = {
+    "TEXT_ANSWER": ("text_answer", 1500),
+    "QUESTION": ("question", 300),
+    "EVENTNAME": ("event_name", 100),
+    "EVENTCODE": ("event_code", None),
+    "QUESTION_TYPE": ("question_type", None),
+    "NPS_GROUP": ("nps_group", None),
+    "RESPONSEID": ("response_id", None),
+}
+
+# Concurrent PutVectors calls per upload; S3 Vectors throttles writes per index
+PUT_VECTORS_MAX_WORKERS = 5
+
+# Shared by every Titan call in the process so concurrent workers stay under
+# the account's request quota; halves on throttling and then recovers
+TITAN_RATE_LIMITER = RateLimiter(float(os.environ.get("BEDROCK_EMBED_RPS", "50")))
+
+# Upper bound on a single retry sleep, in seconds
+MAX_BACKOFF_SECONDS = 30
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Full-jitter exponential backoff so concurrent workers spread their retries."""
+    return random.uniform(0, min(2**attempt, MAX_BACKOFF_SECONDS))
+
+
+def generate_uids(count: int) -> list[str]:
+    """Generate count unique random 7-character IDs."""
+    return generate_random_ids(count, length=7)
 
 
 class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
@@ -37,51 +83,111 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
         self.rate_limit_retries = int(
             os.environ.get("EMBEDDING_RATE_LIMIT_RETRIES", "5")
         )
+        self.max_workers = int(os.environ.get("EMBEDDING_MAX_WORKERS", "16"))
+        self.s3vectors_max_workers = int(os.environ.get("S3_VECTORS_MAX_WORKERS", "10"))
+        # S3 Vectors PutVectors accepts at most 500 vectors per call
+        self.upload_batch_size = min(
+            int(os.environ.get("S3_VECTORS_BATCH_SIZE", "500")), 500
+        )
         self.detailed_logs = (
             os.environ.get("EMBEDDING_DETAILED_LOGS", "false").lower() == "true"
         )
+        self.query_cache_size = int(
+            os.environ.get("EMBEDDING_QUERY_CACHE_SIZE", "1024")
+        )
+        self._query_embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
+        # Tool calls may embed queries from several threads at once
+        self._query_cache_lock = threading.Lock()
 
     def generate_embedding(self, text: str) -> list[float]:
-        """Generate embedding for a single text using AWS Titan."""
-        if not text or pd.isna(text):
+        """Generate embedding for a single text using AWS Titan.
+
+        Titan embeddings are deterministic, so repeated texts are served from
+        the same LRU cache as embed_batch.
+        """
+        return self.embed_batch([text])[0]
+
+    def _embed_text(self, text: str) -> list[float]:
+        """Embed one text without caching; empty input maps to a zero vector."""
+        if not isinstance(text, str) or not text:
             return [0.0] * self.embed_dimension
 
+        return self._invoke_titan(text)
+
+    def _invoke_titan(self, text: str) -> list[float]:
+        """Call Titan for one text and return its embedding."""
+        TITAN_RATE_LIMITER.acquire()
+        # pylint: disable=no-member  # orjson is a compiled extension
         response = self.bedrock_client.invoke_model(
             modelId=self.embed_model,
-            body=json.dumps({"inputText": text}),
+            # Fixed envelope around the escaped text; no per-call dict needed
+            body=b'{"inputText":' + orjson.dumps(text) + b"}",
             contentType="application/json",
             accept="application/json",
         )
+        return orjson.loads(response["body"].read())["embedding"]
 
-        response_body = json.loads(response["body"].read())
-        return response_body["embedding"]
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for multiple texts.
+
+        Titan accepts a single input per InvokeModel call, so uncached texts are
+        embedded concurrently rather than as one batched request. Results are
+        kept in an LRU cache so repeated queries skip Bedrock entirely.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embeddings in the same order as texts
+        """
+        embeddings: dict[str, list[float]] = {}
+        with self._query_cache_lock:
+            for text in texts:
+                if text in self._query_embedding_cache:
+                    self._query_embedding_cache.move_to_end(text)
+                    embeddings[text] = self._query_embedding_cache[text]
+
+        missing = [text for text in dict.fromkeys(texts) if text not in embeddings]
+        logger.info("embedding_cache hits=%d misses=%d", len(embeddings), len(missing))
+        if len(missing) == 1:
+            embeddings[missing[0]] = self._embed_text(missing[0])
+        elif missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                embeddings.update(zip(missing, executor.map(self._embed_text, missing)))
+
+        if missing:
+            with self._query_cache_lock:
+                for text in missing:
+                    self._query_embedding_cache[text] = embeddings[text]
+                while len(self._query_embedding_cache) > self.query_cache_size:
+                    self._query_embedding_cache.popitem(last=False)
+
+        return [embeddings[text] for text in texts]
 
     def _generate_embedding_with_retry(
         self, text: str, text_id: str = ""
-    ) -> tuple[list[float] | None, bool]:
-        """Generate embedding with retry logic for rate limiting."""
-        if not text or pd.isna(text):
-            return [0.0] * self.embed_dimension, True
+    ) -> tuple[np.ndarray | None, bool]:
+        """Generate embedding with retry logic for rate limiting.
+
+        Embeddings are returned as float32 arrays, the precision S3 Vectors
+        stores, so vectors waiting for upload stay compact.
+        """
+        if not isinstance(text, str) or not text:
+            return np.zeros(self.embed_dimension, dtype=np.float32), True
 
         for attempt in range(self.rate_limit_retries):
             try:
-                response = self.bedrock_client.invoke_model(
-                    modelId=self.embed_model,
-                    body=json.dumps({"inputText": text}),
-                    contentType="application/json",
-                    accept="application/json",
-                )
-                response_body = json.loads(response["body"].read())
-                return response_body["embedding"], True
+                return np.asarray(self._invoke_titan(text), dtype=np.float32), True
 
             except ClientError as e:
                 error_code = e.response.get("Error", {}).get("Code", "")
 
                 if error_code == "ThrottlingException":
-                    wait_time = 2**attempt
+                    TITAN_RATE_LIMITER.on_throttle()
+                    wait_time = _backoff_delay(attempt)
                     if self.detailed_logs:
                         logger.debug(
-                            "Rate limit hit for %s, retry %d/%d, waiting %ds...",
+                            "Rate limit hit for %s, retry %d/%d, waiting %.1fs...",
                             text_id,
                             attempt + 1,
                             self.rate_limit_retries,
@@ -97,7 +203,7 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
                         )
                     return None, False
 
-                wait_time = 2**attempt
+                wait_time = _backoff_delay(attempt)
                 if self.detailed_logs:
                     logger.debug(
                         "Error for %s: %s, retry %d/%d",
@@ -121,13 +227,15 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
     def _check_existing_vectors(self, keys: list[str]) -> set[str]:
         """Check which vector keys already exist in S3 Vectors.
 
-        GetVectors API has a limit of 100 keys per call, so we batch the requests.
+        GetVectors API has a limit of 100 keys per call, so we batch the requests
+        and issue the batches concurrently.
         """
-        existing_ids = set()
         batch_size = 100  # S3 Vectors GetVectors limit
+        batches = [keys[i : i + batch_size] for i in range(0, len(keys), batch_size)]
+        if not batches:
+            return set()
 
-        for i in range(0, len(keys), batch_size):
-            batch_keys = keys[i : i + batch_size]
+        def _existing_in_batch(batch_keys: list[str]) -> list[str]:
             try:
                 response = self.s3vectors_client.get_vectors(
                     vectorBucketName=self.bucket_name,
@@ -136,30 +244,65 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
                     returnData=False,
                     returnMetadata=False,
                 )
-                for v in response.get("vectors", []):
-                    existing_ids.add(v["key"])
+                return [v["key"] for v in response.get("vectors", [])]
             except Exception as e:  # pylint: disable=broad-exception-caught
                 if self.detailed_logs:
                     logger.debug("Error checking existing vectors: %s", str(e)[:100])
+                return []
+
+        workers = min(self.s3vectors_max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            existing_ids = set()
+            for batch_existing in executor.map(_existing_in_batch, batches):
+                existing_ids.update(batch_existing)
 
         return existing_ids
 
     def _upload_vectors(self, vectors: list[dict]) -> int:
-        """Upload vectors to S3 Vectors."""
-        if not vectors:
+        """Upload vectors to S3 Vectors in concurrent PutVectors-sized batches."""
+        batches = [
+            vectors[i : i + self.upload_batch_size]
+            for i in range(0, len(vectors), self.upload_batch_size)
+        ]
+        if not batches:
             return 0
 
-        try:
-            self.s3vectors_client.put_vectors(
-                vectorBucketName=self.bucket_name,
-                indexName=self.index_name,
-                vectors=vectors,
-            )
-            logger.info("Uploaded %d vectors to S3", len(vectors))
-            return len(vectors)
-        except Exception as e:
-            logger.error("Error uploading vectors: %s", str(e))
-            raise
+        workers = min(PUT_VECTORS_MAX_WORKERS, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return sum(executor.map(self._put_vectors_batch, batches))
+
+    def _put_vectors_batch(self, batch: list[dict]) -> int:
+        """Write one PutVectors batch, backing off while the index is throttled."""
+        for attempt in range(self.rate_limit_retries):
+            try:
+                self.s3vectors_client.put_vectors(
+                    vectorBucketName=self.bucket_name,
+                    indexName=self.index_name,
+                    vectors=batch,
+                )
+                break
+            except Exception as e:
+                error_code = (
+                    e.response.get("Error", {}).get("Code", "")
+                    if isinstance(e, ClientError)
+                    else ""
+                )
+                if (
+                    error_code == "TooManyRequestsException"
+                    and attempt < self.rate_limit_retries - 1
+                ):
+                    time.sleep(_backoff_delay(attempt))
+                    continue
+                logger.error(
+                    "Error uploading vectors %s..%s: %s",
+                    batch[0]["key"],
+                    batch[-1]["key"],
+                    str(e),
+                )
+                raise
+
+        logger.info("Uploaded %d vectors to S3", len(batch))
+        return len(batch)
 
     def delete_all_vectors(self, csv_name: str, max_count: int = 1000) -> int:
         """Delete all vectors for a given CSV source.
@@ -171,32 +314,68 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
         Returns:
             Number of vectors deleted
         """
+        # Keys are "{csv_name}_{row number}". ListVectors cannot filter by
+        # prefix, so the candidate keys are enumerated instead of scanning the
+        # shared index; DeleteVectors ignores keys that do not exist
         keys_to_delete = [f"{csv_name}_{i}" for i in range(max_count)]
-        total_deleted = 0
         batch_size = 500  # S3 Vectors DeleteVectors limit
+        batches = [
+            keys_to_delete[i : i + batch_size]
+            for i in range(0, len(keys_to_delete), batch_size)
+        ]
+        if not batches:
+            logger.info("No vectors to delete for %s", csv_name)
+            return 0
 
-        for i in range(0, len(keys_to_delete), batch_size):
-            batch_keys = keys_to_delete[i : i + batch_size]
+        def _delete_batch(batch_keys: list[str]) -> int:
             try:
                 self.s3vectors_client.delete_vectors(
                     vectorBucketName=self.bucket_name,
                     indexName=self.index_name,
                     keys=batch_keys,
                 )
-                total_deleted += len(batch_keys)
-                logger.info(
-                    "Deleted batch of %d vectors (total: %d)",
-                    len(batch_keys),
-                    total_deleted,
-                )
             except Exception as e:  # pylint: disable=broad-exception-caught
                 if "NotFound" not in str(e):
                     logger.warning("Error deleting vectors: %s", str(e)[:100])
-                break
+                return 0
+            logger.info("Deleted batch of %d vectors", len(batch_keys))
+            return len(batch_keys)
+
+        workers = min(self.s3vectors_max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            total_deleted = sum(executor.map(_delete_batch, batches))
 
         logger.info("Deleted %d vectors for %s", total_deleted, csv_name)
         return total_deleted
 
+    def _embed_unique_texts(self, rows: pd.DataFrame) -> dict[str, np.ndarray]:
+        """Embed each distinct TEXT_ANSWER in rows, keyed by text.
+
+        Identical answers ("N/A", "yes", ...) are common, so each distinct text
+        is embedded once and shared across its rows. Texts that fail to embed
+        are left out.
+        """
+        unique_rows = rows.drop_duplicates(subset="TEXT_ANSWER")
+        unique_texts = unique_rows["TEXT_ANSWER"].tolist()
+
+        # Titan takes one input per InvokeModel call, so keep several calls in
+        # flight; each worker still backs off on its own throttling errors
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(
+                self._generate_embedding_with_retry,
+                unique_texts,
+                unique_rows["_embedding_id"].tolist(),
+            )
+            embeddings = {
+                text: embedding
+                for text, (embedding, success) in zip(unique_texts, results)
+                if embedding is not None and success
+            }
+        logger.info(
+            "Embedded %d unique texts for %d rows", len(unique_texts), len(rows)
+        )
+        return embeddings
+
     def add_dataframe(  # pylint: disable=too-many-locals
         self, df: pd.DataFrame, csv_name: str, max_rows: int = 1000, row_offset: int = 0
     ) -> None:
@@ -208,12 +387,11 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
             max_rows: Maximum number of rows to process
             row_offset: Starting row number for absolute row numbering (for chunked processing)
         """
-        # Filter rows with non-empty TEXT_ANSWER
-        text_rows = df[df["TEXT_ANSWER"].notna() & (df["TEXT_ANSWER"] != "")].copy()
-
-        # Filter to only include "Text" question types
-        if "QUESTION_TYPE" in text_rows.columns:
-            text_rows = text_rows[text_rows["QUESTION_TYPE"] == "Text"].copy()
+        # Keep non-empty TEXT_ANSWER rows, limited to "Text" question types
+        mask = df["TEXT_ANSWER"].notna() & df["TEXT_ANSWER"].ne("")
+        if "QUESTION_TYPE" in df.columns:
+            mask &= df["QUESTION_TYPE"].eq("Text")
+        text_rows = df.loc[mask]
 
         if len(text_rows) == 0:
             return
@@ -228,17 +406,19 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
             text_rows = text_rows.head(max_rows)
 
         # Create unique IDs for each row with absolute row numbering
-        text_rows["_embedding_id"] = [
-            f"{csv_name}_{row_offset + i}" for i in range(len(text_rows))
-        ]
+        row_numbers = np.arange(row_offset, row_offset + len(text_rows))
+        all_ids = (f"{csv_name}_" + pd.Series(row_numbers).astype(str)).tolist()
+        text_rows = text_rows.assign(_embedding_id=all_ids)
 
         # Check which IDs already exist in S3 Vectors
         logger.info("Checking for existing vectors...")
-        all_ids = [f"{csv_name}_{row_offset + i}" for i in range(len(text_rows))]
         existing_ids = self._check_existing_vectors(all_ids)
 
-        # Filter to only new rows
-        new_rows = text_rows[~text_rows["_embedding_id"].isin(existing_ids)]
+        # Filter to only new rows (nothing to drop on a first import)
+        if existing_ids:
+            new_rows = text_rows[~text_rows["_embedding_id"].isin(existing_ids)]
+        else:
+            new_rows = text_rows
 
         if len(new_rows) == 0:
             logger.info("All %d rows already have embeddings", len(text_rows))
@@ -246,49 +426,60 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
 
         logger.info("Generating embeddings for %d new rows...", len(new_rows))
 
-        # Statistics tracking
-        total_processed = 0
-        total_failed = 0
         start_time = time.time()
 
-        # Accumulate vectors for upload
+        embeddings = self._embed_unique_texts(new_rows)
+
+        # Accumulate vectors and upload each full batch as soon as it is ready
         pending_vectors = []
+        total_processed = 0
+        total_failed = 0
+        # Native float lists for botocore, converted once per text per batch
+        vector_data: dict[str, dict[str, list[float]]] = {}
+
+        # Stringify and truncate metadata columns once; missing columns become ""
+        source = new_rows.reindex(columns=list(METADATA_SOURCE_COLUMNS), fill_value="")
+        metadata_values = pd.DataFrame(
+            {
+                field: source[column].map(str).str.slice(0, max_length)
+                for column, (field, max_length) in METADATA_SOURCE_COLUMNS.items()
+            }
+        )
+        metadata_fields = list(metadata_values.columns)
+        uids = generate_uids(len(new_rows))
+        for key, text, uid, values in zip(
+            new_rows["_embedding_id"],
+            new_rows["TEXT_ANSWER"],
+            uids,
+            metadata_values.itertuples(index=False, name=None),
+        ):
+            embedding = embeddings.get(text)
+            if embedding is None:
+                total_failed += 1
+                continue
 
-        # Process rows sequentially (parallelism is handled by Lambda instances)
-        for _, row in new_rows.iterrows():
-            text = row["TEXT_ANSWER"]
-            text_id = row["_embedding_id"]
-
-            embedding, success = self._generate_embedding_with_retry(text, text_id)
-
-            if embedding is not None and success:
-                # Prepare metadata - keep filterable metadata under 2KB
-                # Store full text in text_answer for search results
-                text_answer = str(row.get("TEXT_ANSWER", ""))
-                metadata = {
-                    "uid": generate_uid(),
-                    "text_answer": text_answer[:1500],  # Main text for results
-                    "question": str(row.get("QUESTION", ""))[:300],
-                    "event_name": str(row.get("EVENTNAME", ""))[:100],
-                    "event_code": str(row.get("EVENTCODE", "")),
-                    "question_type": str(row.get("QUESTION_TYPE", "")),
-                    "nps_group": str(row.get("NPS_GROUP", "")),
-                    "response_id": str(row.get("RESPONSEID", "")),
-                    "csv_source": csv_name,
+            if text not in vector_data:
+                vector_data[text] = {"float32": embedding.tolist()}
+
+            metadata = {
+                "uid": uid,
+                **dict(zip(metadata_fields, values)),
+                "csv_source": csv_name,
+            }
+            pending_vectors.append(
+                {
+                    "key": key,
+                    "data": vector_data[text],
+                    "metadata": metadata,
                 }
-                pending_vectors.append(
-                    {
-                        "key": row["_embedding_id"],
-                        "data": {"float32": embedding},
-                        "metadata": metadata,
-                    }
-                )
-                total_processed += 1
-            else:
-                total_failed += 1
+            )
+            if len(pending_vectors) >= self.upload_batch_size:
+                total_processed += self._upload_vectors(pending_vectors)
+                pending_vectors = []
+                vector_data.clear()
 
-        # Upload all vectors
-        self._upload_vectors(pending_vectors)
+        # Upload remaining vectors
+        total_processed += self._upload_vectors(pending_vectors)
 
         elapsed_time = time.time() - start_time
         success_rate = (total_processed / len(new_rows)) * 100
@@ -309,12 +500,13 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
                 "Average speed: %.1f rows/second", total_processed / elapsed_time
             )
 
-    def search(  # pylint: disable=too-many-locals
+    def search(
         self,
         query: str,
         top_k: int = 20,
         filters: dict[str, str] | None = None,
         exclude_uids: list[str] | None = None,
+        min_score: float | None = None,
     ) -> pd.DataFrame:
         """Search for similar responses using semantic search.
 
@@ -323,33 +515,56 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
             top_k: Number of results to return (max 100 per S3 Vectors API)
             filters: Optional metadata filters (e.g., {'event_name': 'West Virginia'})
             exclude_uids: Optional list of uids to exclude from results using $nin filter
+            min_score: Optional minimum similarity score; lower-scoring rows are dropped
 
         Returns:
             DataFrame with columns: similarity_score, text_answer, question, event_name, etc.
         """
-        # Generate query embedding
         query_embedding = self.generate_embedding(query)
+        return self.search_with_vector(
+            query_embedding,
+            top_k=top_k,
+            filters=filters,
+            exclude_uids=exclude_uids,
+            min_score=min_score,
+        )
 
+    def search_with_vector(
+        self,
+        query_embedding: list[float],
+        top_k: int = 20,
+        filters: dict[str, str] | None = None,
+        exclude_uids: list[str] | None = None,
+        min_score: float | None = None,
+    ) -> pd.DataFrame:
+        """Search for similar responses using a precomputed query embedding.
+
+        Args:
+            query_embedding: Embedding of the search query
+            top_k: Number of results to return (max 100 per S3 Vectors API)
+            filters: Optional metadata filters (e.g., {'event_name': 'West Virginia'})
+            exclude_uids: Optional list of uids to exclude from results using $nin filter
+            min_score: Optional minimum similarity score; lower-scoring rows are dropped
+
+        Returns:
+            DataFrame with columns: similarity_score, text_answer, question, event_name, etc.
+        """
         # Build filter for S3 Vectors
         # S3 Vectors filter syntax: {"field": "value"} or {"$and": [{...}, {...}]}
         metadata_filter = None
-        filter_components = []
-
-        # Add user-provided filters
-        if filters:
-            active_filters = [(key, value) for key, value in filters.items() if value]
-            for key, value in active_filters:
-                filter_components.append({key: value})
-
-        # Add exclusion filter using $nin operator
-        if exclude_uids and len(exclude_uids) > 0:
-            filter_components.append({"uid": {"$nin": exclude_uids}})
-
-        # Combine filters with $and if multiple components
-        if len(filter_components) > 1:
-            metadata_filter = {"$and": filter_components}
-        elif len(filter_components) == 1:
-            metadata_filter = filter_components[0]
+        if filters or exclude_uids:
+            # User-provided filters, plus an exclusion filter using $nin
+            filter_components = [
+                {key: value} for key, value in (filters or {}).items() if value
+            ]
+            if exclude_uids:
+                filter_components.append({"uid": {"$nin": exclude_uids}})
+
+            # Combine filters with $and if multiple components
+            if len(filter_components) > 1:
+                metadata_filter = {"$and": filter_components}
+            elif filter_components:
+                metadata_filter = filter_components[0]
 
         # Query S3 Vectors
         # API docs: queryVector, topK, returnDistance, returnMetadata, filter
@@ -374,28 +589,30 @@ class EmbeddingStore:  # pylint: disable=too-many-instance-attributes
         if not response.get("vectors"):
             return pd.DataFrame()
 
-        # Extract metadata and create DataFrame
+        # Extract metadata column-wise and create DataFrame in one pass
         # S3 Vectors returns 'distance' (lower is better for cosine)
         # Convert to similarity_score (higher is better): similarity = 1 - distance
-        rows = []
-        for vector in response["vectors"]:
-            metadata = vector.get("metadata", {})
-            distance = vector.get("distance", 1.0)
-
-            text_answer = metadata.get("text_answer", "")
-
-            row = {
-                "uid": metadata.get("uid", ""),
-                "similarity_score": 1.0 - distance,  # Convert distance to similarity
-                "text_answer": text_answer,
-                "question": metadata.get("question", ""),
-                "event_name": metadata.get("event_name", ""),
-                "event_code": metadata.get("event_code", ""),
-                "question_type": metadata.get("question_type", ""),
-                "nps_group": metadata.get("nps_group", ""),
-                "response_id": metadata.get("response_id", ""),
-                "csv_source": metadata.get("csv_source", ""),
+        # The query API has no score threshold, so min_score is applied here
+        # before any metadata is read
+        vectors = response["vectors"]
+        similarity = 1.0 - np.fromiter(
+            (vector.get("distance", 1.0) for vector in vectors),
+            dtype=np.float64,
+            count=len(vectors),
+        )
+        if min_score is None:
+            keep = np.arange(len(vectors))
+        else:
+            keep = np.flatnonzero(similarity >= min_score)
+        metadata = [vectors[i].get("metadata", {}) for i in keep]
+
+        return pd.DataFrame(
+            {
+                "uid": [m.get("uid", "") for m in metadata],
+                "similarity_score": similarity[keep],
+                **{
+                    field: [m.get(field, "") for m in metadata]
+                    for field in SEARCH_METADATA_FIELDS
+                },
             }
-            rows.append(row)
-
-        return pd.DataFrame(rows)
+        )
@@ -2,44 +2,86 @@
 
 import os
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
 from typing import Any
 
-import boto3
+from boto3.dynamodb.conditions import Attr
 from botocore.exceptions import ClientError
 
+from backend.core.utils.aws_client_service import get_resource
 from backend.core.utils.logger import get_logger
 
 
+def _convert_leaves(
+    obj: Any, leaf_type: type, convert: Callable[[Any], Any], copy: bool
+) -> Any:
+    """Apply convert to every leaf_type value in a nested dict/list structure.
+
+    Walks the structure with an explicit stack instead of recursion. With
+    copy=True containers are shallow-copied as they are visited so the
+    caller's data is left untouched; otherwise they are updated in place.
+    """
+    if isinstance(obj, leaf_type):
+        return convert(obj)
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    root = type(obj)(obj) if copy else obj
+    stack = [root]
+    while stack:
+        container = stack.pop()
+        items = (
+            container.items() if isinstance(container, dict) else enumerate(container)
+        )
+        for key, value in items:
+            if isinstance(value, leaf_type):
+                container[key] = convert(value)
+            elif isinstance(value, (dict, list)):
+                if copy:
+                    value = container[key] = type(value)(value)
+                stack.append(value)
+    return root
+
+
+@lru_cache(maxsize=4096)
+def _float_to_decimal(value: float) -> Decimal:
+    """Convert a float to Decimal; cached since result payloads repeat scores."""
+    return Decimal(str(value))
+
+
+def _decimal_to_number(value: Decimal) -> int | float:
+    """Convert to int if it's a whole number, otherwise float."""
+    if value % 1 == 0:
+        return int(value)
+    return float(value)
+
+
 def convert_floats_to_decimal(obj: Any) -> Any:
-    """Recursively convert float values to Decimal for DynamoDB compatibility."""
-    if isinstance(obj, float):
-        return Decimal(str(obj))
-    if isinstance(obj, dict):
-        return {k: convert_floats_to_decimal(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [convert_floats_to_decimal(item) for item in obj]
-    return obj
+    """Convert float values to Decimal for DynamoDB compatibility.
+
+    Returns a converted copy; the input is not modified.
+    """
+    return _convert_leaves(obj, float, _float_to_decimal, copy=True)
 
 
 def convert_decimal_to_native(obj: Any) -> Any:
-    """Recursively convert Decimal values to int/float for JSON compatibility."""
-    if isinstance(obj, Decimal):
-        # Convert to int if it's a whole number, otherwise float
-        if obj % 1 == 0:
-            return int(obj)
-        return float(obj)
-    if isinstance(obj, dict):
-        return {k: convert_decimal_to_native(v) for k, v in obj.items()}
-    if isinstance(obj, list):
-        return [convert_decimal_to_native(item) for item in obj]
-    return obj
+    """Convert Decimal values to int/float for JSON compatibility.
+
+    Containers are converted in place, since callers pass freshly
+    deserialized DynamoDB items.
+    """
+    return _convert_leaves(obj, Decimal, _decimal_to_number, copy=False)
 
 
 logger = get_logger(__name__)
 
+# Namespace for deriving job IDs from client idempotency keys
+IDEMPOTENCY_NAMESPACE = uuid.UUID("5c3a8f64-2e0b-4d7a-9b1e-6f4c2d8a7e15")
+
 
 class JobStatus(str, Enum):
     """Enum representing possible job statuses."""
@@ -50,6 +92,12 @@ class JobStatus(str, Enum):
     FAILED = "FAILED"
 
 
+# Jobs may only be completed or failed while still in flight
+ACTIVE_STATUS_CONDITION = Attr("status").is_in(
+    [JobStatus.PENDING.value, JobStatus.PROCESSING.value]
+)
+
+
 class JobService:
     """Service for managing jobs in DynamoDB."""
 
@@ -57,12 +105,12 @@ class JobService:
         self.table_name = table_name or os.environ.get(
             "JOBS_TABLE_NAME", "survey-analysis-jobs"
         )
-        self.dynamodb = boto3.resource("dynamodb")
+        self.dynamodb = get_resource("dynamodb")
         self.table = self.dynamodb.Table(self.table_name)
 
     def create_job(
         self, query: str, idempotency_key: str | None = None
-    ) -> dict[str, Any]:
+    ) -> tuple[dict[str, Any], bool]:
         """Create a new job record.
 
         Args:
@@ -70,18 +118,15 @@ class JobService:
             idempotency_key: Optional key to prevent duplicate submissions
 
         Returns:
-            Job record dict
+            Tuple of (job record dict, whether a new job was created); the
+            flag is False when an existing job matched the idempotency key
         """
-        # Check idempotency key if provided
+        # A retried submission maps to the same job ID, so a conditional put
+        # detects duplicates without a separate lookup
         if idempotency_key:
-            existing = self._get_by_idempotency_key(idempotency_key)
-            if existing:
-                logger.info(
-                    "Returning existing job for idempotency key: %s", idempotency_key
-                )
-                return existing
-
-        job_id = str(uuid.uuid4())
+            job_id = str(uuid.uuid5(IDEMPOTENCY_NAMESPACE, idempotency_key))
+        else:
+            job_id = str(uuid.uuid4())
         now = datetime.now(timezone.utc).isoformat()
         ttl = int((datetime.now(timezone.utc) + timedelta(hours=24)).timestamp())
 
@@ -98,9 +143,20 @@ class JobService:
         if idempotency_key:
             item["idempotencyKey"] = idempotency_key
 
-        self.table.put_item(Item=item)
+        try:
+            self.table.put_item(
+                Item=item, ConditionExpression=Attr("jobId").not_exists()
+            )
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            existing = self._get_existing_job(job_id)
+            if existing:
+                logger.info(
+                    "Returning existing job for idempotency key: %s", idempotency_key
+                )
+                return existing, False
+            raise
         logger.info("Created job: %s", job_id)
-        return item
+        return item, True
 
     def get_job(self, job_id: str) -> dict[str, Any] | None:
         """Get a job by ID.
@@ -124,12 +180,19 @@ class JobService:
     def update_status(self, job_id: str, status: JobStatus) -> bool:
         """Update job status.
 
+        Like complete_job, only applies while the job is still in flight, so a
+        late or repeated invocation cannot reopen a finished job.
+
         Args:
             job_id: The job ID
             status: New status
 
         Returns:
-            True if successful
+            True if updated, False if the job is no longer in flight
+
+        Raises:
+            ClientError: For any other DynamoDB error, so callers can tell a
+                transient failure from a finished job
         """
         now = datetime.now(timezone.utc).isoformat()
         try:
@@ -138,22 +201,33 @@ class JobService:
                 UpdateExpression="SET #status = :status, updatedAt = :now",
                 ExpressionAttributeNames={"#status": "status"},
                 ExpressionAttributeValues={":status": status.value, ":now": now},
+                ConditionExpression=ACTIVE_STATUS_CONDITION,
             )
             logger.info("Updated job %s status to %s", job_id, status.value)
             return True
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            logger.warning("Job %s is no longer in flight; not updating", job_id)
+            return False
         except ClientError as e:
             logger.error("Error updating job %s: %s", job_id, e)
-            return False
+            raise
 
     def complete_job(self, job_id: str, result: dict[str, Any]) -> bool:
         """Mark job as completed with result.
 
+        The write is conditional on the job still being PENDING or PROCESSING,
+        so a duplicate invocation cannot overwrite a finished job.
+
         Args:
             job_id: The job ID
             result: The result data
 
         Returns:
-            True if successful
+            True if updated, False if the job is no longer in flight
+
+        Raises:
+            ClientError: For any other DynamoDB error, so callers can tell a
+                transient failure from a finished job
         """
         now = datetime.now(timezone.utc).isoformat()
         # Convert floats to Decimal for DynamoDB compatibility
@@ -168,22 +242,32 @@ class JobService:
                     ":result": dynamo_result,
                     ":now": now,
                 },
+                ConditionExpression=ACTIVE_STATUS_CONDITION,
             )
             logger.info("Completed job %s", job_id)
             return True
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            logger.warning("Job %s is no longer in flight; not completing", job_id)
+            return False
         except ClientError as e:
             logger.error("Error completing job %s: %s", job_id, e)
-            return False
+            raise
 
     def fail_job(self, job_id: str, error: str) -> bool:
         """Mark job as failed with error.
 
+        Like complete_job, only applies while the job is still in flight.
+
         Args:
             job_id: The job ID
             error: Error message
 
         Returns:
-            True if successful
+            True if updated, False if the job is no longer in flight
+
+        Raises:
+            ClientError: For any other DynamoDB error, so callers can tell a
+                transient failure from a finished job
         """
         now = datetime.now(timezone.utc).isoformat()
         try:
@@ -196,12 +280,16 @@ class JobService:
                     ":error": error,
                     ":now": now,
                 },
+                ConditionExpression=ACTIVE_STATUS_CONDITION,
             )
             logger.info("Failed job %s: %s", job_id, error)
             return True
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            logger.warning("Job %s is no longer in flight; not failing", job_id)
+            return False
         except ClientError as e:
             logger.error("Error failing job %s: %s", job_id, e)
-            return False
+            raise
 
     def increment_retry(self, job_id: str) -> int:
         """Increment retry count and return new value.
@@ -225,16 +313,11 @@ class JobService:
             logger.error("Error incrementing retry for job %s: %s", job_id, e)
             return -1
 
-    def _get_by_idempotency_key(self, idempotency_key: str) -> dict[str, Any] | None:
-        """Get job by idempotency key using scan (acceptable for low volume)."""
+    def _get_existing_job(self, job_id: str) -> dict[str, Any] | None:
+        """Read back a job whose create lost a conditional put."""
         try:
-            response = self.table.scan(
-                FilterExpression="idempotencyKey = :key",
-                ExpressionAttributeValues={":key": idempotency_key},
-                Limit=1,
-            )
-            items = response.get("Items", [])
-            return items[0] if items else None
+            response = self.table.get_item(Key={"jobId": job_id}, ConsistentRead=True)
+            return response.get("Item")
         except ClientError as e:
-            logger.error("Error scanning for idempotency key: %s", e)
+            logger.error("Error getting existing job %s: %s", job_id, e)
             return None
@@ -1,12 +1,14 @@
 """Service for uploading output files to S3."""
 
+import codecs
 import csv
-import io
 import os
-from typing import Any
+import tempfile
+from typing import IO, Any
 
-import boto3
+from boto3.s3.transfer import TransferConfig
 
+from backend.core.utils.aws_client_service import get_client
 from backend.core.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -14,6 +16,16 @@ logger = get_logger(__name__)
 # Presigned URL expiry: 24 hours (matches job TTL)
 URL_EXPIRY_SECONDS = 86400
 
+# Output CSVs stay in memory up to this size, then spill to /tmp
+CSV_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+# Large outputs are uploaded as concurrent 8 MB multipart parts
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    use_threads=True,
+)
+
 
 class S3OutputService:  # pylint: disable=too-few-public-methods
     """Service for uploading CSV output files to S3."""
@@ -22,28 +34,25 @@ class S3OutputService:  # pylint: disable=too-few-public-methods
         self.bucket_name = bucket_name or os.environ.get(
             "OUTPUT_BUCKET_NAME", "survey-agent-data"
         )
-        self.s3_client = boto3.client("s3")
+        self.s3_client = get_client("s3")
 
-    def _generate_csv_content(self, data: list[dict[str, Any]]) -> str:
-        """Generate CSV content from a list of dictionaries.
+    def _write_csv_content(self, data: list[dict[str, Any]], output: IO[bytes]) -> None:
+        """Write UTF-8 encoded CSV content for a list of dictionaries.
 
-        Args:
-            data: List of dictionaries with consistent keys
+        Rows are encoded as they are written, straight to a binary file
+        object, so the content is never held as a separate str.
 
-        Returns:
-            CSV content as a string
+        Args:
+            data: Non-empty list of dictionaries with consistent keys
+            output: Binary file object to write to
         """
-        if not data:
-            return ""
-
-        output = io.StringIO()
-        fieldnames = list(data[0].keys())
         writer = csv.DictWriter(
-            output, fieldnames=fieldnames, quoting=csv.QUOTE_MINIMAL
+            codecs.getwriter("utf-8")(output),
+            fieldnames=list(data[0].keys()),
+            quoting=csv.QUOTE_MINIMAL,
         )
         writer.writeheader()
         writer.writerows(data)
-        return output.getvalue()
 
     def upload_csv_to_s3(
         self,
@@ -68,17 +77,21 @@ class S3OutputService:  # pylint: disable=too-few-public-methods
                 "file_size_bytes": 0,
             }
 
-        csv_content = self._generate_csv_content(data)
-        csv_bytes = csv_content.encode("utf-8")
         s3_key = f"output/{job_id}/{filename}"
 
-        # Upload to S3
-        self.s3_client.put_object(
-            Bucket=self.bucket_name,
-            Key=s3_key,
-            Body=csv_bytes,
-            ContentType="text/csv",
-        )
+        # Spool the CSV (in memory, or /tmp once it grows large) and stream it
+        # to S3 rather than holding str and bytes copies of the whole file
+        with tempfile.SpooledTemporaryFile(max_size=CSV_SPOOL_MAX_BYTES) as output:
+            self._write_csv_content(data, output)
+            file_size_bytes = output.tell()
+            output.seek(0)
+            self.s3_client.upload_fileobj(
+                output,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={"ContentType": "text/csv"},
+                Config=TRANSFER_CONFIG,
+            )
 
         # Generate presigned URL
         presigned_url = self.s3_client.generate_presigned_url(
@@ -92,11 +105,11 @@ class S3OutputService:  # pylint: disable=too-few-public-methods
             job_id=job_id,
             file_name=filename,
             row_count=len(data),
-            file_size_bytes=len(csv_bytes),
+            file_size_bytes=file_size_bytes,
         )
 
         return {
             "s3_url": presigned_url,
             "row_count": len(data),
-            "file_size_bytes": len(csv_bytes),
+            "file_size_bytes": file_size_bytes,
         }
@@ -1,6 +1,6 @@
 """Backend utilities module."""
 
 from backend.core.utils.logger import get_logger, configure_logfire
-from backend.core.utils.aws_client_service import get_client
+from backend.core.utils.aws_client_service import get_client, get_resource
 
-__all__ = ["get_logger", "configure_logfire", "get_client"]
+__all__ = ["get_logger", "configure_logfire", "get_client", "get_resource"]
@@ -3,7 +3,11 @@
 import random
 import string
 
+import numpy as np
+
 _ID_CHARS = string.ascii_letters + string.digits  # [a-zA-Z0-9]
+_ID_CHAR_BYTES = np.frombuffer(_ID_CHARS.encode("ascii"), dtype="S1")
+_rng = np.random.default_rng()
 
 
 def generate_random_id(length: int = 7) -> str:
@@ -16,3 +20,34 @@ def generate_random_id(length: int = 7) -> str:
         Random alphanumeric string of specified length.
     """
     return "".join(random.choices(_ID_CHARS, k=length))
+
+
+def generate_random_ids(count: int, length: int = 7) -> list[str]:
+    """Generate unique random alphanumeric IDs in bulk.
+
+    Draws all characters in a single vectorized call instead of one
+    random.choices call per ID.
+
+    Args:
+        count: Number of IDs to generate.
+        length: Number of characters in each ID. Defaults to 7.
+
+    Returns:
+        List of count distinct random alphanumeric strings.
+
+    Raises:
+        ValueError: If count exceeds the number of possible IDs of this length.
+    """
+    if count > len(_ID_CHARS) ** length:
+        raise ValueError(f"Cannot generate {count} unique IDs of length {length}")
+
+    ids: dict[str, None] = {}
+    while len(ids) < count:
+        needed = count - len(ids)
+        # Oversample slightly so collisions rarely need another round
+        draws = _rng.integers(
+            0, len(_ID_CHAR_BYTES), size=(needed + needed // 10 + 1, length)
+        )
+        candidates = _ID_CHAR_BYTES[draws].view(f"S{length}").ravel()
+        ids.update(dict.fromkeys(candidates.astype(str).tolist()))
+    return list(ids)[:count]
@@ -1,31 +1,104 @@
 """AWS client factory for creating boto3 clients with proper session configuration."""
 
 import os
+import threading
+from functools import lru_cache
 
 import boto3
+from boto3.resources.base import ServiceResource
+from botocore.client import BaseClient
 from botocore.config import Config
 
+# boto3 sessions are not thread-safe, so clients are created one at a time
+_session_lock = threading.Lock()
 
-def get_client(service_name, read_timeout=None):
-    """Create a boto3 client for the specified service.
+
+def get_client(
+    service_name: str,
+    read_timeout: int | None = None,
+    max_pool_connections: int | None = None,
+) -> BaseClient:
+    """Get a boto3 client for the specified service.
+
+    Clients are cached per process, keyed on their configuration, so callers
+    share one client (and its HTTPS connection pool) per service. boto3
+    clients are thread-safe, so the cached instance can be shared across
+    threads.
 
     In Lambda environments, credentials are automatically provided via IAM role.
     For local development, set AWS_PROFILE environment variable if needed.
     """
-    profile_name = os.environ.get(
-        "AWS_PROFILE"
-    )  # Only use profile if explicitly set (for local development)
-    region_name = os.environ.get("AWS_REGION")
+    return _create_client(
+        service_name,
+        read_timeout,
+        max_pool_connections,
+        # Only use profile if explicitly set (for local development)
+        os.environ.get("AWS_PROFILE"),
+        os.environ.get("AWS_REGION"),
+    )
+
+
+def get_resource(service_name: str) -> ServiceResource:
+    """Get a boto3 resource (e.g. DynamoDB) for the specified service.
+
+    Resources are cached per process like clients and use the same retry and
+    connection configuration.
+    """
+    return _create_resource(
+        service_name, os.environ.get("AWS_PROFILE"), os.environ.get("AWS_REGION")
+    )
+
 
+@lru_cache(maxsize=None)
+def _create_session(profile_name: str | None, region_name: str | None) -> boto3.Session:
+    """Create a boto3 session for the given profile and region.
+
+    Cached so every client and resource in the process shares one session,
+    and with it the loaded service models and credential resolution.
+    """
     if profile_name:
         # Local development with profile
-        session = boto3.Session(region_name=region_name, profile_name=profile_name)
-    else:
-        # Lambda or default credentials (IAM role)
-        session = boto3.Session(region_name=region_name)
+        return boto3.Session(region_name=region_name, profile_name=profile_name)
+    # Lambda or default credentials (IAM role)
+    return boto3.Session(region_name=region_name)
+
 
-    config = None
+def _client_config(
+    read_timeout: int | None = None, max_pool_connections: int | None = None
+) -> Config:
+    """Build the botocore config shared by all clients and resources."""
+    config_kwargs = {
+        "retries": {"mode": "adaptive", "total_max_attempts": 5},
+        "tcp_keepalive": True,
+    }
     if read_timeout:
-        config = Config(read_timeout=read_timeout)
+        config_kwargs["read_timeout"] = read_timeout
+    if max_pool_connections:
+        config_kwargs["max_pool_connections"] = max_pool_connections
+    return Config(**config_kwargs)
+
+
+@lru_cache(maxsize=None)
+def _create_client(
+    service_name: str,
+    read_timeout: int | None,
+    max_pool_connections: int | None,
+    profile_name: str | None,
+    region_name: str | None,
+) -> BaseClient:
+    """Create a boto3 client; cached by get_client."""
+    with _session_lock:
+        session = _create_session(profile_name, region_name)
+        return session.client(
+            service_name, config=_client_config(read_timeout, max_pool_connections)
+        )
+
 
-    return session.client(service_name, config=config)
+@lru_cache(maxsize=None)
+def _create_resource(
+    service_name: str, profile_name: str | None, region_name: str | None
+) -> ServiceResource:
+    """Create a boto3 resource; cached by get_resource."""
+    with _session_lock:
+        session = _create_session(profile_name, region_name)
+        return session.resource(service_name, config=_client_config())
@@ -23,8 +23,15 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from aws_lambda_powertools import Logger
 
+# Lambda configuration is fixed for the life of a container, so read it once
+_IS_LAMBDA = bool(os.environ.get("AWS_LAMBDA_FUNCTION_NAME"))
+_LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+_SERVICE_NAME = os.environ.get("POWERTOOLS_SERVICE_NAME", "survey-analysis")
+
 # Module-level logger instance for Lambda environments
 _powertools_logger: "Logger | None" = None  # pylint: disable=invalid-name
+# Set once the root logger has been configured for local development
+_local_configured = False  # pylint: disable=invalid-name
 
 
 def get_logger(name: str | None = None) -> "Logger | logging.Logger":
@@ -42,7 +49,7 @@ def get_logger(name: str | None = None) -> "Logger | logging.Logger":
     Returns:
         Configured logger instance.
     """
-    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    if _IS_LAMBDA:
         return _get_powertools_logger(name)
     return _get_local_logger(name)
 
@@ -55,12 +62,9 @@ def _get_powertools_logger(name: str | None = None) -> "Logger":
         # pylint: disable-next=import-outside-toplevel
         from aws_lambda_powertools import Logger
 
-        service_name = os.environ.get("POWERTOOLS_SERVICE_NAME", "survey-analysis")
-        log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-
         _powertools_logger = Logger(
-            service=service_name,
-            level=log_level,
+            service=_SERVICE_NAME,
+            level=_LOG_LEVEL,
             # Include function context automatically
             log_uncaught_exceptions=True,
         )
@@ -74,16 +78,17 @@ def _get_powertools_logger(name: str | None = None) -> "Logger":
 
 def _get_local_logger(name: str | None = None) -> logging.Logger:
     """Get standard Python logger for local development."""
-    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
-    log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    global _local_configured  # pylint: disable=global-statement
 
     # Configure root logger once
-    if not logging.getLogger().handlers:
-        logging.basicConfig(
-            level=log_level,
-            format=log_format,
-            handlers=[logging.StreamHandler(sys.stdout)],
-        )
+    if not _local_configured:
+        if not logging.getLogger().handlers:
+            logging.basicConfig(
+                level=_LOG_LEVEL,
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                handlers=[logging.StreamHandler(sys.stdout)],
+            )
+        _local_configured = True
 
     return logging.getLogger(name)
 
@@ -94,7 +99,7 @@ def configure_logfire():
     Skips logfire configuration in the Lambda environment - uses CloudWatch Logs only.
     """
     # Skip logfire in Lambda - use CloudWatch Logs only
-    if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
+    if _IS_LAMBDA:
         return
 
     try:
@@ -0,0 +1,69 @@
+"""Client-side request rate limiting for throttled AWS APIs."""
+
+import threading
+import time
+
+
+class RateLimiter:  # pylint: disable=too-many-instance-attributes
+    """Thread-safe token bucket with additive-increase/multiplicative-decrease.
+
+    Callers block in acquire() until a request fits under the current rate.
+    A throttling response halves the rate, at most once per cooldown_seconds
+    so that one burst of throttled workers counts once; the rate then climbs
+    back linearly to the configured maximum over recovery_seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 1.0,
+        recovery_seconds: float = 30.0,
+        cooldown_seconds: float = 1.0,
+    ):
+        if rate <= 0 or min_rate <= 0:
+            raise ValueError(
+                f"Rate limits must be positive (rate={rate}, min_rate={min_rate})"
+            )
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.recovery_seconds = recovery_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self._tokens = 1.0
+        self._last = time.monotonic()
+        self._last_throttle = float("-inf")
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until one request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                elapsed = now - self._last
+                self._last = now
+                # Additive increase back toward max_rate after a throttle
+                self.rate = min(
+                    self.max_rate,
+                    self.rate + elapsed * self.max_rate / self.recovery_seconds,
+                )
+                # Allow bursts of up to one second's worth of requests, and
+                # always at least one so rates below 1/s still make progress
+                self._tokens = min(
+                    max(1.0, self.rate), self._tokens + elapsed * self.rate
+                )
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait_time = (1.0 - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+    def on_throttle(self) -> None:
+        """Halve the allowed rate after the service reports throttling."""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_throttle < self.cooldown_seconds:
+                # Same burst; the rate was already halved for it
+                return
+            self._last_throttle = now
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = min(self._tokens, 1.0)
@@ -1,9 +1,11 @@
 """Lambda request parsing utilities for different event sources."""
 
-import json
+from collections.abc import Sequence
 from typing import Any
 from urllib.parse import unquote_plus
 
+from backend.core.utils import serialization
+
 # =============================================================================
 # API Gateway Request Parsing
 # =============================================================================
@@ -26,8 +28,8 @@ def parse_api_gateway_body(event: dict[str, Any]) -> dict[str, Any]:
         raise ValueError("Missing request body")
 
     try:
-        return json.loads(body)
-    except json.JSONDecodeError as e:
+        return serialization.loads(body)
+    except serialization.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in request body: {e}") from e
 
 
@@ -56,25 +58,44 @@ def extract_path_parameter(
     return value
 
 
+def lowercase_headers(event: dict[str, Any]) -> dict[str, str]:
+    """Return the event's headers keyed by lowercase header name.
+
+    Build this once per event when several headers are needed and pass it
+    to extract_header.
+
+    Args:
+        event: API Gateway event dict
+
+    Returns:
+        Dict of lowercase header name to value
+    """
+    return {k.lower(): v for k, v in (event.get("headers") or {}).items()}
+
+
 def extract_header(
-    event: dict[str, Any], header_name: str, default: str | None = None
+    event: dict[str, Any],
+    header_name: str,
+    default: str | None = None,
+    headers: dict[str, str] | None = None,
 ) -> str | None:
     """Extract a header from API Gateway event (case-insensitive).
 
-    API Gateway may lowercase headers, so this checks both cases.
+    API Gateway may change header case, so names are compared lowercased.
 
     Args:
         event: API Gateway event dict
         header_name: Name of the header to extract (e.g., 'X-Idempotency-Key')
         default: Default value if header not found
+        headers: Optional result of lowercase_headers(event) to reuse
 
     Returns:
         The header value, or default if not found
     """
-    headers = event.get("headers") or {}
+    if headers is None:
+        headers = lowercase_headers(event)
 
-    # Try exact case first, then lowercase
-    value = headers.get(header_name) or headers.get(header_name.lower())
+    value = headers.get(header_name.lower())
 
     return value if value else default
 
@@ -113,13 +134,13 @@ def parse_sqs_message(record: dict[str, Any]) -> dict[str, Any]:
         raise ValueError("Missing SQS message body")
 
     try:
-        return json.loads(body)
-    except json.JSONDecodeError as e:
+        return serialization.loads(body)
+    except serialization.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in SQS message: {e}") from e
 
 
 def parse_sqs_event(
-    event: dict[str, Any], required_fields: list[str] | None = None
+    event: dict[str, Any], required_fields: Sequence[str] | None = None
 ) -> dict[str, Any]:
     """Parse SQS event and extract message body with validation.
 
@@ -128,7 +149,7 @@ def parse_sqs_event(
 
     Args:
         event: SQS event containing Records
-        required_fields: Optional list of required fields to validate
+        required_fields: Optional sequence of required fields to validate
 
     Returns:
         Parsed message body as dict
@@ -187,7 +208,7 @@ def parse_s3_event(record: dict[str, Any], url_decode: bool = True) -> dict[str,
 
 
 def parse_async_lambda_event(
-    event: dict[str, Any], required_fields: list[str] | None = None
+    event: dict[str, Any], required_fields: Sequence[str] | None = None
 ) -> dict[str, Any]:
     """Parse event from async Lambda invocation.
 
@@ -196,7 +217,7 @@ def parse_async_lambda_event(
 
     Args:
         event: Lambda event dict (direct payload, not wrapped)
-        required_fields: Optional list of required fields to validate
+        required_fields: Optional sequence of required fields to validate
 
     Returns:
         The event dict (possibly validated)
@@ -215,22 +236,29 @@ def parse_async_lambda_event(
 # =============================================================================
 
 
-def validate_required_fields(data: dict[str, Any], fields: list[str]) -> None:
+def validate_required_fields(data: dict[str, Any], fields: Sequence[str]) -> None:
     """Validate that all required fields exist and are non-empty in data.
 
     Args:
         data: Dict to validate
-        fields: List of required field names
+        fields: Sequence of required field names
 
     Raises:
         KeyError: If any field is missing or empty
     """
-    for field in fields:
-        value = data.get(field)
-        if value is None:
-            raise KeyError(f"Missing required field: {field}")
-        if isinstance(value, str) and not value.strip():
-            raise KeyError(f"{field} must be a non-empty string")
+    invalid = next((f for f in fields if _is_blank(data.get(f))), None)
+    if invalid is None:
+        return
+
+    # Only the failing field needs the more specific diagnosis
+    if data.get(invalid) is None:
+        raise KeyError(f"Missing required field: {invalid}")
+    raise KeyError(f"{invalid} must be a non-empty string")
+
+
+def _is_blank(value: Any) -> bool:
+    """Return True if value is None or a whitespace-only string."""
+    return value is None or (isinstance(value, str) and not value.strip())
 
 
 def validate_numeric_range(
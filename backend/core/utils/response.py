@@ -1,8 +1,9 @@
 """Lambda response utilities for consistent response formatting."""
 
-import json
 from typing import Any
 
+from backend.core.utils import serialization
+
 # Base CORS headers for simple responses (S3-triggered lambdas, etc.)
 CORS_HEADERS = {
     "Content-Type": "application/json",
@@ -67,7 +68,10 @@ def success_response(
     Returns:
         Lambda response dict with statusCode, body, and optional headers
     """
-    response: dict[str, Any] = {"statusCode": status_code, "body": json.dumps(body)}
+    response: dict[str, Any] = {
+        "statusCode": status_code,
+        "body": serialization.dumps(body),
+    }
 
     headers = _build_headers(include_cors, use_api_cors, extra_headers)
     if headers:
@@ -109,7 +113,34 @@ def error_response(  # pylint: disable=too-many-arguments,too-many-positional-ar
     if metadata:
         body["metadata"] = metadata
 
-    response: dict[str, Any] = {"statusCode": status_code, "body": json.dumps(body)}
+    response: dict[str, Any] = {
+        "statusCode": status_code,
+        "body": serialization.dumps(body),
+    }
+
+    headers = _build_headers(include_cors, use_api_cors, extra_headers)
+    if headers:
+        response["headers"] = headers
+
+    return response
+
+
+def not_modified_response(
+    include_cors: bool = False,
+    use_api_cors: bool = False,
+    extra_headers: dict[str, str] | None = None,
+) -> dict[str, Any]:
+    """Build a 304 Not Modified response for a matching conditional request.
+
+    Args:
+        include_cors: Whether to include CORS headers
+        use_api_cors: Use extended API CORS headers (includes X-Request-Id, etc.)
+        extra_headers: Additional headers to include (e.g., ETag, Cache-Control)
+
+    Returns:
+        Lambda response dict with 304 status, empty body, and optional headers
+    """
+    response: dict[str, Any] = {"statusCode": 304, "body": ""}
 
     headers = _build_headers(include_cors, use_api_cors, extra_headers)
     if headers:
@@ -129,7 +160,7 @@ def options_response(use_api_cors: bool = False) -> dict[str, Any]:
     """
     return {
         "statusCode": 200,
-        "headers": API_CORS_HEADERS if use_api_cors else CORS_HEADERS,
+        "headers": dict(API_CORS_HEADERS if use_api_cors else CORS_HEADERS),
         "body": "",
     }
 
@@ -147,9 +178,9 @@ def async_response(body: dict[str, Any], include_cors: bool = False) -> dict[str
     Returns:
         Lambda response dict with statusCode and body
     """
-    response: dict[str, Any] = {"statusCode": 200, "body": json.dumps(body)}
+    response: dict[str, Any] = {"statusCode": 200, "body": serialization.dumps(body)}
     if include_cors:
-        response["headers"] = CORS_HEADERS
+        response["headers"] = dict(CORS_HEADERS)
     return response
 
 
@@ -166,4 +197,4 @@ def async_error_response(error: str, status_code: int = 500) -> dict[str, Any]:
     Returns:
         Lambda response dict with statusCode and body
     """
-    return {"statusCode": status_code, "body": json.dumps({"error": error})}
+    return {"statusCode": status_code, "body": serialization.dumps({"error": error})}
@@ -0,0 +1,34 @@
+"""JSON serialization helpers backed by orjson when it is installed.
+
+orjson is several times faster than the stdlib json module for both parsing
+and serializing. Lambdas that do not package it fall back to json with the
+same interface.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the Lambda's requirements
+    orjson = None  # pylint: disable=invalid-name
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+# catch this regardless of which backend is active
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to a JSON string."""
+    if orjson is not None:
+        # pylint: disable=no-member  # orjson is a compiled extension
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj)
+
+
+def loads(data: str | bytes) -> Any:
+    """Deserialize a JSON string or bytes."""
+    if orjson is not None:
+        # pylint: disable=no-member  # orjson is a compiled extension
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,14 +1,14 @@
 """Lambda handler for S3 CSV upload events - chunks CSVs and sends to SQS."""
 
-import json
+import csv
 import os
-import uuid
+import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any
 
-import pandas as pd
-
-from backend.core.utils import get_client
+from backend.core.utils import get_client, serialization
 from backend.core.utils.logger import get_logger
 from backend.core.utils.request import parse_s3_event
 from backend.core.utils.response import success_response, error_response
@@ -23,6 +23,20 @@ sqs_client = get_client("sqs")
 CHUNK_SIZE = int(os.environ.get("CHUNK_SIZE", "500"))
 CHUNK_QUEUE_URL = os.environ.get("CHUNK_QUEUE_URL")
 
+# SendMessageBatch accepts at most 10 entries per call
+SQS_BATCH_SIZE = 10
+# Matches botocore's default connection pool size
+SQS_SEND_MAX_WORKERS = 10
+
+# Bytes read from S3 per step while scanning a CSV for record boundaries
+CSV_SCAN_BLOCK_BYTES = 8 * 1024 * 1024
+
+# Characters pandas treats as blank when skipping empty lines
+BLANK_LINE_CHARS = " \t\r\n"
+
+# Free-text answers can exceed the csv module's default 128 KB field limit
+csv.field_size_limit(sys.maxsize)
+
 
 @logger.inject_lambda_context(log_event=True)
 def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
@@ -39,23 +53,23 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     Returns:
         Response dict with statusCode and body
     """
-    try:
-        # Validate configuration
-        if not CHUNK_QUEUE_URL:
-            logger.error("CHUNK_QUEUE_URL environment variable not set")
-            return error_response(
-                error="Missing CHUNK_QUEUE_URL configuration", status_code=500
-            )
-
-        logger.info(
-            "Starting CSV upload processing",
-            chunk_size=CHUNK_SIZE,
-            queue_url=CHUNK_QUEUE_URL,
+    # Validate configuration
+    if not CHUNK_QUEUE_URL:
+        logger.error("CHUNK_QUEUE_URL environment variable not set")
+        return error_response(
+            error="Missing CHUNK_QUEUE_URL configuration", status_code=500
         )
 
-        # Process each S3 record in the event
-        total_chunks_sent = 0
+    logger.info(
+        "Starting CSV upload processing",
+        chunk_size=CHUNK_SIZE,
+        queue_url=CHUNK_QUEUE_URL,
+    )
+
+    # Process each S3 record in the event
+    total_chunks_sent = 0
 
+    try:
         for record in event.get("Records", []):
             # Parse S3 event details using utility (handles URL decoding)
             s3_details = parse_s3_event(record)
@@ -78,21 +92,25 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
                 "CSV file processed", key=s3_details["s3_key"], chunks_sent=chunks_sent
             )
 
-        return success_response(
-            body={
-                "message": "CSV upload processed successfully",
-                "total_chunks_sent": total_chunks_sent,
-            }
-        )
-
     except Exception as e:  # pylint: disable=broad-exception-caught
         logger.exception("Error processing S3 event")
         return error_response(error=str(e), status_code=500)
 
+    return success_response(
+        body={
+            "message": "CSV upload processed successfully",
+            "total_chunks_sent": total_chunks_sent,
+        }
+    )
+
 
 def process_csv_file(bucket: str, key: str) -> int:
     """
-    Download CSV from S3, chunk it, and send messages to SQS.
+    Index the rows of a CSV in S3, chunk it, and send messages to SQS.
+
+    The object is streamed once to find record boundaries. Each chunk
+    message carries its byte range along with the header's, so consumers
+    can fetch just their rows with ranged GETs.
 
     Args:
         bucket: S3 bucket name
@@ -102,70 +120,66 @@ def process_csv_file(bucket: str, key: str) -> int:
         Number of chunks sent to SQS
 
     Raises:
-        Exception: If file download, parsing, or SQS send fails
+        Exception: If file read or SQS send fails
     """
-    # Download CSV from S3 to /tmp
-    local_path = f"/tmp/{os.path.basename(key)}"
-
+    logger.info("Streaming CSV from S3", bucket=bucket, key=key)
     try:
-        logger.info(
-            "Downloading file from S3", bucket=bucket, key=key, local_path=local_path
-        )
-        s3_client.download_file(bucket, key, local_path)
-        logger.info("Downloaded CSV", local_path=local_path)
+        response = s3_client.get_object(Bucket=bucket, Key=key)
     except s3_client.exceptions.NoSuchKey as exc:
         logger.error("File not found in S3", bucket=bucket, key=key)
         raise FileNotFoundError(f"S3 object not found: {key}") from exc
     except Exception:
-        logger.exception("Failed to download from S3")
+        logger.exception("Failed to read from S3")
         raise
 
-    # Read CSV with pandas
     try:
-        logger.info("Reading CSV file", local_path=local_path)
-        df = pd.read_csv(local_path)
-        total_rows = len(df)
-        logger.info("Read CSV", total_rows=total_rows)
-
-        # Check for empty CSV
-        if total_rows == 0:
-            logger.warning("CSV file is empty", key=key)
-            return 0
-
-    except pd.errors.EmptyDataError:
-        logger.warning("CSV file is empty or has no data", key=key)
-        return 0
-    except pd.errors.ParserError as e:
-        logger.error("Failed to parse CSV", error=str(e))
-        raise ValueError(f"CSV parsing error: {str(e)}") from e
+        header_end, total_rows, chunk_ranges = index_csv_chunks(
+            response["Body"], CHUNK_SIZE
+        )
+    except csv.Error as exc:
+        logger.error("Failed to parse CSV", error=str(exc))
+        raise ValueError(f"CSV parsing error: {str(exc)}") from exc
     except Exception:
         logger.exception("Failed to read CSV")
         raise
+    finally:
+        response["Body"].close()
+    logger.info("Read CSV", total_rows=total_rows)
+
+    # Check for empty CSV
+    if total_rows == 0:
+        logger.warning("CSV file is empty or has no data", key=key)
+        return 0
 
     # Calculate chunks
-    total_chunks = (total_rows + CHUNK_SIZE - 1) // CHUNK_SIZE
+    total_chunks = len(chunk_ranges)
     logger.info("Creating chunks", total_chunks=total_chunks, chunk_size=CHUNK_SIZE)
 
-    # Create chunk messages
-    messages = []
-    timestamp = datetime.now(timezone.utc).isoformat()
-
-    for chunk_num in range(total_chunks):
-        start_row = chunk_num * CHUNK_SIZE
-        end_row = min(start_row + CHUNK_SIZE, total_rows)
-
-        message = {
+    # Create chunk messages; only the row and byte ranges and chunk number
+    # vary, so the per-file fields are serialized once and each body is
+    # spliced onto them. The ETag pins consumers to the version indexed here.
+    message_bodies = []
+    base_fragment = serialization.dumps(
+        {
             "s3_bucket": bucket,
             "s3_key": key,
-            "start_row": start_row,
-            "end_row": end_row,
-            "chunk_number": chunk_num,
+            "etag": response["ETag"],
+            "header_end": header_end,
             "total_rows": total_rows,
             "total_chunks": total_chunks,
-            "timestamp": timestamp,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
         }
+    )[:-1]
 
-        messages.append(message)
+    for chunk_num, (byte_start, byte_end) in enumerate(chunk_ranges):
+        start_row = chunk_num * CHUNK_SIZE
+        end_row = min(start_row + CHUNK_SIZE, total_rows)
+
+        message_bodies.append(
+            f'{base_fragment},"start_row":{start_row},"end_row":{end_row},'
+            f'"byte_start":{byte_start},"byte_end":{byte_end},'
+            f'"chunk_number":{chunk_num}}}'
+        )
         logger.debug(
             "Chunk created",
             chunk_number=chunk_num,
@@ -174,26 +188,116 @@ def process_csv_file(bucket: str, key: str) -> int:
         )
 
     # Send messages to SQS in batches of 10 (SQS limit)
-    chunks_sent = send_messages_to_sqs(messages)
+    return send_messages_to_sqs(message_bodies)
 
-    # Clean up temporary file
-    try:
-        os.remove(local_path)
-        logger.debug("Removed temporary file", local_path=local_path)
-    except OSError as e:
-        logger.warning(
-            "Failed to remove temporary file", local_path=local_path, error=str(e)
-        )
 
-    return chunks_sent
+def index_csv_chunks(
+    stream: Any, chunk_size: int
+) -> tuple[int, int, list[tuple[int, int]]]:
+    """
+    Split a binary CSV stream into byte ranges of chunk_size data rows.
 
+    Args:
+        stream: Binary file-like object positioned at the start of the CSV
+        chunk_size: Number of data rows per chunk
 
-def send_messages_to_sqs(messages: list[dict[str, Any]]) -> int:
+    Returns:
+        Tuple of (header end offset, number of data rows, list of
+        (byte_start, byte_end) per chunk). Offsets are absolute and end
+        offsets are exclusive.
+    """
+    records = iter_csv_records(stream)
+    header = next(records, None)
+    if header is None:
+        return 0, 0, []
+
+    total_rows = 0
+    chunk_ranges: list[list[int]] = []
+    for record_start, record_end in records:
+        if total_rows % chunk_size == 0:
+            chunk_ranges.append([record_start, record_end])
+        else:
+            chunk_ranges[-1][1] = record_end
+        total_rows += 1
+
+    return header[1], total_rows, [tuple(bounds) for bounds in chunk_ranges]
+
+
+def iter_csv_records(
+    stream: Any, block_size: int = CSV_SCAN_BLOCK_BYTES
+) -> Iterator[tuple[int, int]]:
     """
-    Send messages to SQS in batches of 10 (API limit).
+    Yield the (start, end) byte offsets of each non-blank CSV record.
+
+    Records are split by csv.reader, which follows the same quoting rules as
+    pandas.read_csv: a quote only opens a quoted field at the start of the
+    field, so a newline inside one does not end the record while a stray
+    quote mid-field (5" tall) is literal. Lines may end in \n, \r\n, or a
+    bare \r, and lines holding only spaces and tabs are skipped, as pandas
+    does with skip_blank_lines.
+
+    Args:
+        stream: Binary file-like object positioned at the start of the CSV
+        block_size: Number of bytes to read per step
+
+    Yields:
+        Absolute (start, end) offsets; end is exclusive and includes the
+        record's line terminator
+    """
+    lines = CountingLineReader(stream, block_size)
+    record_start = 0
+    # csv.reader pulls lines only until the current record is complete, so
+    # the bytes consumed so far always end at a record boundary
+    for _fields in csv.reader(lines):
+        # A blank record is a single line; whitespace can never close a
+        # quoted field, so it is never the last line of a longer record
+        if lines.line.strip(BLANK_LINE_CHARS):
+            yield record_start, lines.offset
+        record_start = lines.offset
+
+
+class CountingLineReader:
+    """Iterate a binary stream as text lines, counting the bytes consumed.
+
+    Lines are decoded as latin-1, which maps each byte to one character, so
+    delimiters, quotes, and newlines are found whatever the file's encoding.
+    """
+
+    def __init__(self, stream: Any, block_size: int = CSV_SCAN_BLOCK_BYTES):
+        self.offset = 0
+        self.line = ""  # most recently returned line
+        self._lines = self._read_lines(stream, block_size)
+
+    def __iter__(self) -> "CountingLineReader":
+        return self
+
+    def __next__(self) -> str:
+        line = next(self._lines)
+        self.offset += len(line)
+        self.line = line.decode("latin-1")
+        return self.line
+
+    @staticmethod
+    def _read_lines(stream: Any, block_size: int) -> Iterator[bytes]:
+        """Yield the stream's lines, each with its \n, \r\n, or \r ending."""
+        pending = b""
+        while block := stream.read(block_size):
+            lines = (pending + block).splitlines(keepends=True)
+            # Hold back an unterminated last line, and one ending in \r whose
+            # \n may start the next block
+            pending = lines.pop() if not lines[-1].endswith(b"\n") else b""
+            yield from lines
+        # Final line without a trailing newline
+        if pending:
+            yield pending
+
+
+def send_messages_to_sqs(message_bodies: list[str]) -> int:
+    """
+    Send messages to SQS in concurrent batches of 10 (API limit).
 
     Args:
-        messages: List of message dictionaries to send
+        message_bodies: List of JSON-serialized message bodies to send
 
     Returns:
         Number of messages successfully sent
@@ -201,37 +305,32 @@ def send_messages_to_sqs(messages: list[dict[str, Any]]) -> int:
     Raises:
         Exception: If SQS send fails
     """
-    total_sent = 0
-    batch = []
-    batch_number = 1
+    # Split into batches of 10 (SQS limit). Entry Ids only need to be unique
+    # within a batch, so the position in the batch is enough
+    batches = [
+        [
+            {"Id": str(index), "MessageBody": body}
+            for index, body in enumerate(message_bodies[start : start + SQS_BATCH_SIZE])
+        ]
+        for start in range(0, len(message_bodies), SQS_BATCH_SIZE)
+    ]
+    if not batches:
+        return 0
 
-    for msg in messages:
-        batch.append({"Id": str(uuid.uuid4()), "MessageBody": json.dumps(msg)})
+    logger.info(
+        "Sending batches to SQS",
+        batch_count=len(batches),
+        total_messages=len(message_bodies),
+    )
 
-        # Send batch when it reaches 10 messages
-        if len(batch) == 10:
-            logger.info(
-                "Sending batch to SQS",
-                batch_number=batch_number,
-                chunks_start=total_sent,
-                chunks_end=total_sent + len(batch) - 1,
-            )
-            send_batch(batch)
-            total_sent += len(batch)
-            batch = []
-            batch_number += 1
-
-    # Send remaining messages
-    if batch:
-        logger.info(
-            "Sending batch to SQS",
-            batch_number=batch_number,
-            chunks_start=total_sent,
-            chunks_end=total_sent + len(batch) - 1,
-        )
-        send_batch(batch)
-        total_sent += len(batch)
+    # Batches are independent, so send them concurrently; map re-raises the
+    # first failure
+    with ThreadPoolExecutor(
+        max_workers=min(SQS_SEND_MAX_WORKERS, len(batches))
+    ) as executor:
+        list(executor.map(send_batch, batches))
 
+    total_sent = len(message_bodies)
     logger.info("Successfully sent messages to SQS", total_sent=total_sent)
     return total_sent
 
@@ -6,50 +6,160 @@ This Lambda function:
 2. Downloads and reads the specific CSV chunk from S3
 3. Generates embeddings using EmbeddingStore (Bedrock Titan)
 4. Uploads vectors to S3 Vectors
-5. Deletes SQS message on success or allows retry on failure
+5. Reports failed messages so only those are retried
 """
 
+import io
 import os
-import uuid
+from functools import lru_cache
 from typing import Any
 
 import pandas as pd
 from botocore.exceptions import ClientError
 
-from backend.core.services.embeddings_service import EmbeddingStore
+from backend.core.services.embeddings_service import (
+    METADATA_SOURCE_COLUMNS,
+    EmbeddingStore,
+)
 from backend.core.utils import get_client
 from backend.core.utils.logger import get_logger
-from backend.core.utils.request import parse_sqs_event, validate_numeric_range
-from backend.core.utils.response import success_response
+from backend.core.utils.request import (
+    parse_sqs_message,
+    validate_numeric_range,
+    validate_required_fields,
+)
 
 logger = get_logger(__name__)
 
 # Initialize AWS clients
 s3_client = get_client("s3")
-bedrock_client = get_client("bedrock-runtime")
+# Pool sized to match the concurrent embedding calls made by add_dataframe
+bedrock_client = get_client(
+    "bedrock-runtime",
+    max_pool_connections=int(os.environ.get("EMBEDDING_MAX_WORKERS", "16")),
+)
+
+# Reused across invocations in a warm container
+embedding_store = EmbeddingStore(bedrock_client)
 
 # Required fields for chunk metadata
-CHUNK_REQUIRED_FIELDS = [
+CHUNK_REQUIRED_FIELDS = (
     "s3_bucket",
     "s3_key",
     "start_row",
     "end_row",
     "chunk_number",
     "total_chunks",
-]
+)
+
+# Only the columns add_dataframe reads are parsed from each chunk
+CSV_COLUMNS = frozenset(METADATA_SOURCE_COLUMNS)
+
+# Chunks are not started with less than this much invocation time left
+MIN_REMAINING_TIME_MS = 60_000
+
+# Queue the chunks are consumed from; deferred chunks are released back to it
+CHUNK_QUEUE_URL = os.environ.get("CHUNK_QUEUE_URL")
+# ChangeMessageVisibilityBatch accepts at most 10 entries per call
+SQS_BATCH_SIZE = 10
+
+# Byte-range fields set by the upload handler; absent on older messages
+BYTE_RANGE_FIELDS = ("etag", "header_end", "byte_start", "byte_end")
 
 
 @logger.inject_lambda_context(log_event=True)
-def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
+def lambda_handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """
     Main Lambda handler for processing SQS messages with CSV chunk metadata.
 
+    Processes every record in the batch and reports the ones that failed,
+    so only those messages are retried.
+
     Args:
         event: SQS event containing Records with CSV chunk metadata
-        _context: Lambda context object
+        context: Lambda context object
 
     Returns:
-        dict with statusCode and body
+        dict with batchItemFailures listing failed message IDs
+    """
+    failures = []
+    deferred = []
+
+    for record in event.get("Records", []):
+        if context.get_remaining_time_in_millis() < MIN_REMAINING_TIME_MS:
+            # Leave the rest for a retry rather than timing out mid-chunk
+            logger.warning(
+                "Not enough time left for chunk; deferring",
+                message_id=record["messageId"],
+            )
+            failures.append({"itemIdentifier": record["messageId"]})
+            deferred.append(record)
+            continue
+
+        try:
+            process_record(record)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # Already logged with its retriability by process_record
+            failures.append({"itemIdentifier": record["messageId"]})
+
+    if failures:
+        logger.warning(
+            "Some chunks failed",
+            failed_count=len(failures),
+            total_count=len(event.get("Records", [])),
+        )
+    if deferred:
+        release_records(deferred)
+
+    return {"batchItemFailures": failures}
+
+
+def release_records(records: list[dict[str, Any]]) -> None:
+    """
+    Make deferred messages visible again right away.
+
+    Reported failures otherwise stay hidden for the queue's full visibility
+    timeout, which is sized for retrying genuine failures, not for chunks
+    that were never attempted. Errors are only logged; the messages then
+    reappear once the timeout expires.
+
+    Args:
+        records: SQS records to release
+    """
+    if not CHUNK_QUEUE_URL:
+        return
+
+    sqs_client = get_client("sqs")
+    for start in range(0, len(records), SQS_BATCH_SIZE):
+        entries = [
+            {
+                "Id": str(index),
+                "ReceiptHandle": record["receiptHandle"],
+                "VisibilityTimeout": 0,
+            }
+            for index, record in enumerate(records[start : start + SQS_BATCH_SIZE])
+        ]
+        try:
+            response = sqs_client.change_message_visibility_batch(
+                QueueUrl=CHUNK_QUEUE_URL, Entries=entries
+            )
+            if response.get("Failed"):
+                logger.warning(
+                    "Failed to release deferred chunks", failed=response["Failed"]
+                )
+        except ClientError:
+            logger.exception("Failed to release deferred chunks")
+
+
+def process_record(record: dict[str, Any]) -> dict[str, Any]:
+    """
+    Parse, validate and process a single SQS record.
+
+    Args:
+        record: SQS record whose body holds CSV chunk metadata
+
+    Returns:
+        dict with processing statistics
 
     Raises:
         ValueError: For invalid message format (non-retriable)
@@ -57,8 +167,9 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         Exception: For unexpected errors (retriable)
     """
     try:
-        # Parse SQS event and validate required fields
-        chunk_metadata = parse_sqs_event(event, required_fields=CHUNK_REQUIRED_FIELDS)
+        # Parse SQS message and validate required fields
+        chunk_metadata = parse_sqs_message(record)
+        validate_required_fields(chunk_metadata, CHUNK_REQUIRED_FIELDS)
 
         # Validate row range
         validate_numeric_range(chunk_metadata, "start_row", "end_row")
@@ -78,6 +189,11 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             start_row=chunk_metadata["start_row"],
             end_row=chunk_metadata["end_row"],
             chunk_number=chunk_metadata["chunk_number"],
+            byte_range=(
+                {field: chunk_metadata[field] for field in BYTE_RANGE_FIELDS}
+                if all(field in chunk_metadata for field in BYTE_RANGE_FIELDS)
+                else None
+            ),
         )
 
         logger.info(
@@ -86,7 +202,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             result=result,
         )
 
-        return success_response(body=result)
+        return result
 
     except (ValueError, KeyError) as e:
         # Non-retriable errors (invalid message format)
@@ -101,27 +217,109 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             logger.error("CSV file not found (non-retriable)", error_code=error_code)
             raise
 
+        if error_code == "PreconditionFailed":
+            # CSV was replaced after it was chunked; its new upload is chunked
+            # separately - non-retriable
+            logger.error("CSV file changed (non-retriable)", error_code=error_code)
+            raise
+
         # Other AWS errors are retriable (throttling, network, etc.)
         logger.error("AWS error (retriable)", error_code=error_code, exc_info=True)
         raise
 
-    except Exception as e:
+    except Exception:
         # Unexpected errors - retriable
         logger.exception("Unexpected error (retriable)")
         raise
 
 
-def read_csv_chunk(bucket: str, key: str, start_row: int, end_row: int) -> pd.DataFrame:
+def _is_csv_column(column: str) -> bool:
+    """Return True for CSV columns used when embedding; others are not parsed."""
+    return column in CSV_COLUMNS
+
+
+@lru_cache(maxsize=8)
+def read_csv_header(bucket: str, key: str, etag: str, header_end: int) -> bytes:
     """
-    Download CSV from S3 and read only the specified row range.
+    Fetch the header line of a CSV; cached across chunks of the same object.
 
-    Uses pandas skiprows and nrows for memory-efficient reading of large CSVs.
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        etag: ETag of the object version that was chunked
+        header_end: Byte offset just past the header line
+
+    Returns:
+        Header bytes including the line terminator
+    """
+    response = s3_client.get_object(
+        Bucket=bucket, Key=key, Range=f"bytes=0-{header_end - 1}", IfMatch=etag
+    )
+    return response["Body"].read()
+
+
+def read_csv_byte_range(
+    bucket: str, key: str, byte_range: dict[str, Any]
+) -> pd.DataFrame:
+    """
+    Read one chunk of a CSV with ranged GETs for its header and rows.
+
+    Args:
+        bucket: S3 bucket name
+        key: S3 object key
+        byte_range: Dict with etag, header_end, byte_start and byte_end
+            (exclusive) as computed by the upload handler
+
+    Returns:
+        DataFrame containing only the chunk's rows
+
+    Raises:
+        ClientError: If S3 read fails (PreconditionFailed if the object changed)
+        Exception: If CSV parsing fails
+    """
+    etag = byte_range["etag"]
+    header = read_csv_header(bucket, key, etag, byte_range["header_end"])
+
+    logger.info(
+        "Reading byte range from S3",
+        bucket=bucket,
+        key=key,
+        byte_start=byte_range["byte_start"],
+        byte_end=byte_range["byte_end"],
+    )
+    response = s3_client.get_object(
+        Bucket=bucket,
+        Key=key,
+        Range=f"bytes={byte_range['byte_start']}-{byte_range['byte_end'] - 1}",
+        IfMatch=etag,
+    )
+    df = pd.read_csv(
+        io.BytesIO(header + response["Body"].read()), usecols=_is_csv_column
+    )
+
+    logger.info("Read rows from CSV", rows_read=len(df))
+    return df
+
+
+def read_csv_chunk(
+    bucket: str,
+    key: str,
+    start_row: int,
+    end_row: int,
+    byte_range: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    """
+    Read only the specified row range of a CSV in S3.
+
+    When the message carries a byte range, only those bytes are fetched.
+    Otherwise the file is downloaded and read with pandas skiprows and nrows.
 
     Args:
         bucket: S3 bucket name
         key: S3 object key
         start_row: Starting row number (0-indexed, inclusive)
         end_row: Ending row number (0-indexed, exclusive)
+        byte_range: Optional byte range fields from the chunk message
 
     Returns:
         DataFrame containing only the specified rows
@@ -130,52 +328,55 @@ def read_csv_chunk(bucket: str, key: str, start_row: int, end_row: int) -> pd.Da
         ClientError: If S3 download fails
         Exception: If CSV parsing fails
     """
-    local_path = f"/tmp/{uuid.uuid4()}.csv"
+    if byte_range:
+        return read_csv_byte_range(bucket, key, byte_range)
 
-    try:
+    # Download into memory; no /tmp file to create and clean up
+    logger.info("Downloading from S3", bucket=bucket, key=key)
+    buffer = io.BytesIO()
+    s3_client.download_fileobj(bucket, key, buffer)
+    buffer.seek(0)
+
+    # Calculate number of rows to read
+    num_rows = end_row - start_row
+
+    if start_row == 0:
+        # Read from beginning (preserve header)
         logger.info(
-            "Downloading from S3", bucket=bucket, key=key, local_path=local_path
+            "Reading rows from beginning",
+            start_row=0,
+            end_row=end_row,
+            num_rows=num_rows,
+        )
+        df = pd.read_csv(buffer, nrows=num_rows, usecols=_is_csv_column)
+    else:
+        # Skip header + rows before start_row
+        # skiprows expects 0-indexed row numbers
+        # Row 0 is header, so skip rows 1 to start_row (inclusive)
+        logger.info(
+            "Reading rows with skip",
+            start_row=start_row,
+            end_row=end_row,
+            skip_data_rows=start_row,
+        )
+        df = pd.read_csv(
+            buffer,
+            skiprows=range(1, start_row + 1),
+            nrows=num_rows,
+            usecols=_is_csv_column,
         )
-        s3_client.download_file(bucket, key, local_path)
-
-        # Calculate number of rows to read
-        num_rows = end_row - start_row
-
-        if start_row == 0:
-            # Read from beginning (preserve header)
-            logger.info(
-                "Reading rows from beginning",
-                start_row=0,
-                end_row=end_row,
-                num_rows=num_rows,
-            )
-            df = pd.read_csv(local_path, nrows=num_rows)
-        else:
-            # Skip header + rows before start_row
-            # skiprows expects 0-indexed row numbers
-            # Row 0 is header, so skip rows 1 to start_row (inclusive)
-            logger.info(
-                "Reading rows with skip",
-                start_row=start_row,
-                end_row=end_row,
-                skip_data_rows=start_row,
-            )
-            df = pd.read_csv(
-                local_path, skiprows=range(1, start_row + 1), nrows=num_rows
-            )
-
-        logger.info("Read rows from CSV", rows_read=len(df))
-        return df
 
-    finally:
-        # Always cleanup temp file
-        if os.path.exists(local_path):
-            os.remove(local_path)
-            logger.debug("Cleaned up temp file", local_path=local_path)
+    logger.info("Read rows from CSV", rows_read=len(df))
+    return df
 
 
-def process_csv_chunk(
-    bucket: str, key: str, start_row: int, end_row: int, chunk_number: int
+def process_csv_chunk(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    bucket: str,
+    key: str,
+    start_row: int,
+    end_row: int,
+    chunk_number: int,
+    byte_range: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     """
     Process a CSV chunk by generating embeddings and uploading to S3 Vectors.
@@ -186,6 +387,7 @@ def process_csv_chunk(
         start_row: Starting row number (0-indexed, inclusive)
         end_row: Ending row number (0-indexed, exclusive)
         chunk_number: Chunk number (for logging)
+        byte_range: Optional byte range fields from the chunk message
 
     Returns:
         dict with processing statistics
@@ -194,14 +396,11 @@ def process_csv_chunk(
         Exception: If embedding generation or upload fails
     """
     # Read CSV chunk
-    df = read_csv_chunk(bucket, key, start_row, end_row)
+    df = read_csv_chunk(bucket, key, start_row, end_row, byte_range)
 
     # Extract CSV name (without extension) for vector keys
     csv_name = os.path.splitext(os.path.basename(key))[0]
 
-    # Initialize EmbeddingStore
-    embedding_store = EmbeddingStore(bedrock_client)
-
     # Generate embeddings with absolute row numbering
     # Pass start_row as row_offset to ensure unique vector keys across chunks
     logger.info("Generating embeddings", csv_name=csv_name, row_offset=start_row)
@@ -4,13 +4,12 @@ Lambda handler for job initiation.
 Creates job in DynamoDB and invokes agent Lambda asynchronously.
 """
 
-import json
 import os
 import uuid
 from typing import Any
 
 from backend.core.services.job_service import JobService, JobStatus
-from backend.core.utils import get_client
+from backend.core.utils import get_client, serialization
 from backend.core.utils.logger import get_logger
 from backend.core.utils.request import (
     extract_header,
@@ -28,10 +27,12 @@ logger = get_logger(__name__)
 
 # Initialize services at module level
 job_service = JobService()
-lambda_client = get_client("lambda")
 
 AGENT_LAMBDA_NAME = os.environ.get("AGENT_LAMBDA_NAME", "survey-analysis-agent")
 
+# Required fields in the request body
+REQUEST_REQUIRED_FIELDS = ("query",)
+
 
 @logger.inject_lambda_context(log_event=True)
 def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
@@ -61,7 +62,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             )
 
         try:
-            validate_required_fields(body, ["query"])
+            validate_required_fields(body, REQUEST_REQUIRED_FIELDS)
             query = body["query"]
         except KeyError as e:
             logger.warning(
@@ -80,27 +81,35 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         idempotency_key = extract_header(event, "X-Idempotency-Key")
 
         # Create a job
-        job = job_service.create_job(query=query, idempotency_key=idempotency_key)
+        job, created = job_service.create_job(
+            query=query, idempotency_key=idempotency_key
+        )
         job_id = job["jobId"]
 
-        # Invoke agent Lambda asynchronously
-        payload = {"jobId": job_id, "query": query, "retryCount": 0}
-        lambda_client.invoke(
-            FunctionName=AGENT_LAMBDA_NAME,
-            InvocationType="Event",
-            Payload=json.dumps(payload),
-        )
-        logger.info(
-            "Created job and invoked agent",
-            job_id=job_id,
-            agent_lambda=AGENT_LAMBDA_NAME,
-        )
+        if created:
+            # Invoke agent Lambda asynchronously
+            # The client is created on first use (get_client caches it), so
+            # preflight and rejected requests never load the Lambda service model
+            payload = {"jobId": job_id, "query": query, "retryCount": 0}
+            get_client("lambda").invoke(
+                FunctionName=AGENT_LAMBDA_NAME,
+                InvocationType="Event",
+                Payload=serialization.dumps(payload),
+            )
+            logger.info(
+                "Created job and invoked agent",
+                job_id=job_id,
+                agent_lambda=AGENT_LAMBDA_NAME,
+            )
+        else:
+            # A retried submission; the agent was invoked for the original
+            logger.info("Returning existing job", job_id=job_id)
 
         # Return 202 Accepted
         return success_response(
             body={
                 "jobId": job_id,
-                "status": JobStatus.PENDING.value,
+                "status": job.get("status", JobStatus.PENDING.value),
                 "createdAt": job["createdAt"],
                 "links": {"self": f"/jobs/{job_id}"},
             },
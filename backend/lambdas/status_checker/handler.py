@@ -4,14 +4,20 @@ Lambda handler for job status checking.
 Returns job status and result from DynamoDB.
 """
 
+import hashlib
 import uuid
 from typing import Any
 
 from backend.core.services.job_service import JobService, JobStatus
 from backend.core.utils.logger import get_logger
-from backend.core.utils.request import extract_path_parameter, is_options_request
+from backend.core.utils.request import (
+    extract_header,
+    extract_path_parameter,
+    is_options_request,
+)
 from backend.core.utils.response import (
     error_response,
+    not_modified_response,
     options_response,
     success_response,
 )
@@ -61,8 +67,28 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
                 extra_headers={"X-Request-Id": request_id},
             )
 
-        # Build response based on status
         status = job.get("status")
+
+        # Every status change also bumps updatedAt, so the pair identifies
+        # the response body; pollers revalidate instead of re-downloading it
+        etag = job_etag(job_id, status, job.get("updatedAt"))
+        extra_headers = {
+            "X-Request-Id": request_id,
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+        }
+
+        # Add Retry-After for non-terminal states
+        if status in (JobStatus.PENDING.value, JobStatus.PROCESSING.value):
+            extra_headers["Retry-After"] = "3"
+
+        if etag_matches(extract_header(event, "If-None-Match"), etag):
+            logger.info("Job status not modified", job_id=job_id, status=status)
+            return not_modified_response(
+                include_cors=True, use_api_cors=True, extra_headers=extra_headers
+            )
+
+        # Build response based on status
         response_body: dict[str, Any] = {
             "jobId": job_id,
             "status": status,
@@ -78,13 +104,6 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
         if status == JobStatus.FAILED.value and "error" in job:
             response_body["error"] = job["error"]
 
-        # Build extra headers
-        extra_headers = {"X-Request-Id": request_id}
-
-        # Add Retry-After for non-terminal states
-        if status in (JobStatus.PENDING.value, JobStatus.PROCESSING.value):
-            extra_headers["Retry-After"] = "3"
-
         logger.info("Returning job status", job_id=job_id, status=status)
 
         return success_response(
@@ -105,3 +124,23 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
             use_api_cors=True,
             extra_headers={"X-Request-Id": request_id},
         )
+
+
+def job_etag(job_id: str, status: str | None, updated_at: str | None) -> str:
+    """Build a quoted ETag for a job's current status response."""
+    digest = hashlib.md5(
+        f"{job_id}|{status}|{updated_at}".encode(), usedforsecurity=False
+    ).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag.
+
+    Handles the wildcard, comma-separated lists, and weak validators, which
+    compare equal to strong ones for If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
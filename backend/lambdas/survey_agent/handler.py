@@ -3,9 +3,14 @@ Lambda handler for survey analysis agent.
 Handles async job invocations from Job Initiator Lambda.
 """
 
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from botocore.exceptions import ClientError
+
+from backend.core.agents.bedrock_model import LATENCY_OPTIMIZED
 from backend.core.agents.survey_agent import init_agent, run_query_with_citations
 from backend.core.services.job_service import JobService, JobStatus
 from backend.core.services.s3_output_service import S3OutputService
@@ -24,6 +29,10 @@ logger.info("Agent initialized")
 
 MAX_RETRIES = 3
 RETRY_BASE_DELAY_SECONDS = 2
+MAX_RETRY_DELAY_SECONDS = 30
+
+# Required fields in the async invocation payload
+JOB_REQUIRED_FIELDS = ("jobId", "query")
 
 
 @logger.inject_lambda_context(log_event=True)
@@ -31,7 +40,7 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
     """Handle async job invocations from Job Initiator."""
     try:
         # Parse and validate async Lambda event
-        payload = parse_async_lambda_event(event, required_fields=["jobId", "query"])
+        payload = parse_async_lambda_event(event, required_fields=JOB_REQUIRED_FIELDS)
         job_id = payload["jobId"]
         query = payload["query"]
     except KeyError as e:
@@ -46,19 +55,36 @@ def lambda_handler(event: dict[str, Any], _context: Any) -> dict[str, Any]:
 def _handle_async_job(job_id: str, query: str) -> dict[str, Any]:
     """Handle async job invocation from Job Initiator."""
     logger.info("Processing async job", job_id=job_id)
-    job_service.update_status(job_id, JobStatus.PROCESSING)
+    try:
+        if not job_service.update_status(job_id, JobStatus.PROCESSING):
+            # Already finished; rerunning would overwrite its output CSVs
+            # without updating the stored result
+            logger.warning("Job is not in flight; skipping", job_id=job_id)
+            return async_response(body={"success": False, "jobId": job_id})
+    except ClientError:
+        # Transient DynamoDB error: run the job anyway. It stays PENDING until
+        # then, and complete_job and fail_job accept PENDING jobs too
+        logger.warning(
+            "Could not mark job as processing; continuing", job_id=job_id, exc_info=True
+        )
 
     last_error: Exception | None = None
 
     for attempt in range(MAX_RETRIES + 1):
         if attempt > 0:
+            # Exponential backoff with jitter so retries of concurrent jobs
+            # spread out instead of hitting a throttled model together
+            delay_seconds = min(
+                MAX_RETRY_DELAY_SECONDS,
+                RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1) + random.uniform(0, 1),
+            )
             logger.info(
                 "Retrying job",
                 job_id=job_id,
                 attempt=attempt + 1,
-                delay_seconds=RETRY_BASE_DELAY_SECONDS,
+                delay_seconds=round(delay_seconds, 2),
             )
-            time.sleep(RETRY_BASE_DELAY_SECONDS)
+            time.sleep(delay_seconds)
 
         start_time = time.time()
 
@@ -66,17 +92,22 @@ def _handle_async_job(job_id: str, query: str) -> dict[str, Any]:
             result = run_query_with_citations(survey_agent, embedding_store, query)
             execution_time_ms = int((time.time() - start_time) * 1000)
 
-            # Upload results to S3
-            cited_responses_ref = s3_output_service.upload_csv_to_s3(
-                job_id=job_id,
-                filename="cited_responses.csv",
-                data=result["cited_responses"],
-            )
-            search_results_ref = s3_output_service.upload_csv_to_s3(
-                job_id=job_id,
-                filename="search_results.csv",
-                data=result["search_results"],
-            )
+            # Upload both result files to S3 concurrently
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                cited_future = executor.submit(
+                    s3_output_service.upload_csv_to_s3,
+                    job_id=job_id,
+                    filename="cited_responses.csv",
+                    data=result["cited_responses"],
+                )
+                search_future = executor.submit(
+                    s3_output_service.upload_csv_to_s3,
+                    job_id=job_id,
+                    filename="search_results.csv",
+                    data=result["search_results"],
+                )
+                cited_responses_ref = cited_future.result()
+                search_results_ref = search_future.result()
 
             job_result = {
                 "response": result["response"],
@@ -89,12 +120,17 @@ def _handle_async_job(job_id: str, query: str) -> dict[str, Any]:
                 },
             }
 
-            job_service.complete_job(job_id, job_result)
+            # Raises on DynamoDB errors, which are retried below like any
+            # other failure; False only means the job already finished
+            if not job_service.complete_job(job_id, job_result):
+                logger.warning("Job already finished; result not stored", job_id=job_id)
+                return async_response(body={"success": False, "jobId": job_id})
             logger.info(
                 "Job completed",
                 job_id=job_id,
                 execution_time_ms=execution_time_ms,
                 attempt=attempt + 1,
+                latency_optimized=LATENCY_OPTIMIZED,
             )
             return async_response(body={"success": True, "jobId": job_id})
 
@@ -108,7 +144,8 @@ def _handle_async_job(job_id: str, query: str) -> dict[str, Any]:
                 exc_info=True,
             )
 
-    # All retries exhausted
+    # All retries exhausted. If even this write fails, raise so the async
+    # invocation is retried rather than leaving the job in flight forever
     job_service.fail_job(job_id, str(last_error))
     logger.error(
         "Job failed after max retries", job_id=job_id, total_attempts=MAX_RETRIES + 1
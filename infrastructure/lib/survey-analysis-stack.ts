@@ -203,6 +203,8 @@ export class SurveyAnalysisStack extends cdk.Stack {
                 S3_VECTOR_BUCKET_NAME: vectorBucket.vectorBucketName!,
                 S3_VECTOR_INDEX_NAME: vectorIndex.indexName!,
                 BEDROCK_MODEL_NAME: 'us.anthropic.claude-sonnet-4-5-20250929-v1:0',
+                // Set to 'true' only for models/regions that support latency-optimized inference
+                BEDROCK_LATENCY_OPTIMIZED: 'false',
                 JOBS_TABLE_NAME: jobsTable.tableName,
                 LOG_LEVEL: 'INFO',
                 POWERTOOLS_SERVICE_NAME: 'survey-agent',
@@ -477,12 +479,16 @@ export class SurveyAnalysisStack extends cdk.Stack {
         // Main queue for CSV chunks
         const csvChunkQueue = new sqs.Queue(this, 'CsvChunkQueue', {
             queueName: 'survey-analysis-csv-chunks',
-            visibilityTimeout: cdk.Duration.minutes(5),
+            // At least 6x the consumer's 5 minute timeout plus its 5 second
+            // batching window, as recommended for SQS event sources
+            visibilityTimeout: cdk.Duration.minutes(31),
             retentionPeriod: cdk.Duration.days(4),
             receiveMessageWaitTime: cdk.Duration.seconds(20), // Long polling
             deadLetterQueue: {
                 queue: csvChunkDLQ,
-                maxReceiveCount: 3,
+                // Chunks deferred for lack of invocation time also count as
+                // receives, so leave headroom beyond genuine failures
+                maxReceiveCount: 5,
             },
         });
 
@@ -562,9 +568,10 @@ export class SurveyAnalysisStack extends cdk.Stack {
                 CSV_UPLOADS_BUCKET: dataBucket.bucketName,
                 S3_VECTOR_BUCKET_NAME: vectorBucket.vectorBucketName!,
                 S3_VECTOR_INDEX_NAME: 'survey-responses',
-                EMBEDDING_MAX_WORKERS: '1',
+                EMBEDDING_MAX_WORKERS: '16',
                 EMBEDDING_RATE_LIMIT_RETRIES: '5',
                 EMBEDDING_BATCH_SIZE: '100',
+                CHUNK_QUEUE_URL: csvChunkQueue.queueUrl,
                 LOG_LEVEL: 'INFO',
                 POWERTOOLS_SERVICE_NAME: 'embedding-consumer',
             },
@@ -574,8 +581,10 @@ export class SurveyAnalysisStack extends cdk.Stack {
         // Configure SQS event source
         embeddingConsumerLambda.addEventSource(
             new lambda_event_sources.SqsEventSource(csvChunkQueue, {
-                batchSize: 1,
-                maxBatchingWindow: cdk.Duration.seconds(0),
+                // Small enough that most batches finish inside the timeout,
+                // so few chunks are deferred to a retry
+                batchSize: 5,
+                maxBatchingWindow: cdk.Duration.seconds(5),
                 reportBatchItemFailures: true,
                 maxConcurrency: 5,
             })